@@ -1,3 +1,104 @@
+from datetime import timedelta
+
 from django.contrib import admin
+from django.db import transaction
+from django.db.models import Case, DurationField, ExpressionWrapper, F, IntegerField, Sum, Value, When
+from django.db.models.functions import Now
+from django.utils import timezone
+
+from .admin_mixins import EstimateCountAdminMixin
+from .models import BoardGame, StockReservation
+
+
+@admin.register(BoardGame)
+class BoardGameAdmin(EstimateCountAdminMixin, admin.ModelAdmin):
+    list_display = ('name', 'year_published', 'condition', 'msrp_price', 'stock_quantity', 'is_sold')
+    list_filter = ('condition', 'is_sold', 'year_published')
+    search_fields = ('name', 'designer')
+
+
+@admin.register(StockReservation)
+class StockReservationAdmin(EstimateCountAdminMixin, admin.ModelAdmin):
+    list_display = (
+        'id', 'game', 'customer_name', 'customer_email', 'quantity', 'status',
+        'expires_at', 'time_remaining_display',
+    )
+    list_filter = ('status',)
+    search_fields = ('customer_name', 'customer_email', 'game__name')
+    list_select_related = ('game',)
+    actions = ['confirm_selected_reservations', 'cancel_selected_reservations', 'extend_selected_reservations']
+
+    def get_queryset(self, request):
+        # Compute time left in SQL so the column is sortable and no per-row
+        # datetime arithmetic runs in Python
+        return super().get_queryset(request).annotate(
+            time_left=ExpressionWrapper(F('expires_at') - Now(), output_field=DurationField())
+        )
+
+    @admin.display(description='Time remaining', ordering='time_left')
+    def time_remaining_display(self, obj):
+        if obj.status != 'active':
+            return '-'
+        if obj.time_left <= timedelta(0):
+            return 'Expired'
+        return f'{int(obj.time_left.total_seconds() // 60)} min'
+
+    def _lock(self, queryset, **filters):
+        """
+        Lock the matching reservation rows and return them as a fresh queryset.
+        
+        Rows already locked by a concurrent action are skipped. Must run inside
+        transaction.atomic().
+        """
+        ids = list(
+            queryset.select_for_update(skip_locked=True, of=('self',))
+            .filter(**filters)
+            .values_list('pk', flat=True)
+        )
+        return StockReservation.objects.filter(pk__in=ids)
+
+    @admin.action(description='Confirm selected reservations')
+    @transaction.atomic
+    def confirm_selected_reservations(self, request, queryset):
+        """Confirm active reservations and reduce stock with set-based UPDATEs."""
+        active = self._lock(queryset, status='active')
+        totals = {
+            row['game_id']: row['total']
+            for row in active.values('game_id').annotate(total=Sum('quantity'))
+        }
+        if not totals:
+            self.message_user(request, 'No active reservations selected.')
+            return
+
+        # One UPDATE for all games: subtract the reserved total per game
+        BoardGame.objects.filter(id__in=totals).update(
+            stock_quantity=F('stock_quantity') - Case(
+                *[When(id=game_id, then=Value(total)) for game_id, total in totals.items()],
+                default=Value(0),
+                output_field=IntegerField(),
+            )
+        )
+        now = timezone.now()
+        BoardGame.objects.filter(id__in=totals, stock_quantity__lte=0, is_sold=False).update(
+            is_sold=True, sold_date=now
+        )
+        count = active.update(status='confirmed', confirmed_at=now)
+        self.message_user(request, f'{count} reservation(s) confirmed.')
+
+    @admin.action(description='Cancel selected reservations')
+    @transaction.atomic
+    def cancel_selected_reservations(self, request, queryset):
+        """Cancel active reservations in one UPDATE."""
+        count = self._lock(queryset, status='active').update(
+            status='cancelled', cancelled_at=timezone.now()
+        )
+        self.message_user(request, f'{count} reservation(s) cancelled.')
 
-# Register your models here.
+    @admin.action(description='Extend selected reservations by 30 minutes')
+    @transaction.atomic
+    def extend_selected_reservations(self, request, queryset):
+        """Extend active reservations in one UPDATE."""
+        count = self._lock(queryset, status='active').update(
+            expires_at=timezone.now() + timedelta(minutes=30)
+        )
+        self.message_user(request, f'{count} reservation(s) extended.')
@@ -0,0 +1,46 @@
+"""
+Admin helpers - paginators and mixins for large changelist pages.
+"""
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class EstimateCountPaginator(Paginator):
+    """
+    Paginator that reads the planner's row estimate for unfiltered querysets.
+
+    On PostgreSQL an unfiltered changelist uses pg_class.reltuples instead of
+    a full-table COUNT(*). Filtered querysets, other databases and tables that
+    have never been analyzed fall back to the exact count.
+    """
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is None or query.where:
+            return super().count
+
+        connection = connections[self.object_list.db]
+        if connection.vendor != 'postgresql':
+            return super().count
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                [self.object_list.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+
+        # reltuples is -1 (or 0) until the table has been vacuumed/analyzed
+        if not row or row[0] <= 0:
+            return super().count
+        return row[0]
+
+
+class EstimateCountAdminMixin:
+    """ModelAdmin mixin that avoids COUNT(*) queries on large changelists."""
+
+    paginator = EstimateCountPaginator
+    show_full_result_count = False
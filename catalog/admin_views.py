@@ -5,14 +5,31 @@ Admin panel views - CRUD operations for board games and inventory management.
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib import messages
+from django.core.cache import cache
+from django.core.paginator import Paginator
 from django.db import transaction
 from .models import BoardGame, StockReservation
 
+EXPIRE_RESERVATIONS_LOCK_KEY = 'catalog:expire_reservations'
+ADMIN_PANEL_PAGE_SIZE = 50
+
+# Columns written by edit_game; BGG-sourced data (images, ratings, etc.) is untouched.
+# sold_date is maintained by BoardGame.save() and updated_at by auto_now.
+EDIT_GAME_FIELDS = [
+    'name', 'designer', 'year_published', 'description', 'stock_quantity',
+    'condition', 'msrp_price', 'discount_percentage', 'notes', 'is_sold', 'sold_date',
+    'min_players', 'max_players', 'min_playtime', 'max_playtime', 'min_age',
+    'updated_at',
+]
+
 
 @staff_member_required
 def admin_panel(request):
     """Main admin panel - list all games."""
-    games = BoardGame.objects.all().order_by('-created_at')
+    games = BoardGame.objects.only(
+        'id', 'name', 'year_published', 'designer', 'thumbnail_url', 'msrp_price',
+        'discount_percentage', 'stock_quantity', 'condition', 'is_sold',
+    ).order_by('-created_at')
     
     # Filter options
     show_sold = request.GET.get('show_sold', '')
@@ -23,8 +40,12 @@ def admin_panel(request):
     if search_query:
         games = games.filter(name__icontains=search_query)
     
+    # Render one page at a time so memory stays bounded as the catalog grows
+    page_obj = Paginator(games, ADMIN_PANEL_PAGE_SIZE).get_page(request.GET.get('page'))
+    
     context = {
-        'games': games,
+        'games': page_obj.object_list,
+        'page_obj': page_obj,
         'search_query': search_query,
         'show_sold': show_sold,
     }
@@ -57,7 +78,7 @@ def edit_game(request, game_id):
         game.max_playtime = request.POST.get('max_playtime') or None
         game.min_age = request.POST.get('min_age') or None
         
-        game.save()
+        game.save(update_fields=EDIT_GAME_FIELDS)
         messages.success(request, f'Game "{game.name}" updated successfully!')
         return redirect('admin_panel')
     
@@ -87,11 +108,16 @@ def delete_game(request, game_id):
 @staff_member_required
 def reservation_management(request):
     """Manage stock reservations."""
-    # Expire old reservations first
-    StockReservation.expire_old_reservations()
+    # Expire old reservations, at most once per minute per cache; the
+    # expire_reservations management command can also run on a schedule
+    if cache.add(EXPIRE_RESERVATIONS_LOCK_KEY, True, timeout=60):
+        StockReservation.expire_old_reservations()
     
     # Get all reservations
-    reservations = StockReservation.objects.all().select_related('game')
+    reservations = StockReservation.objects.select_related('game').only(
+        'id', 'quantity', 'status', 'customer_name', 'customer_email',
+        'reserved_at', 'expires_at', 'game__name',
+    )
     
     # Filter by status
     status = request.GET.get('status', 'active')
@@ -10,12 +10,29 @@ using multiple data sources with a fallback strategy:
 """
 
 import requests
-import xml.etree.ElementTree as ET
-from bs4 import BeautifulSoup
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util import make_headers
+from urllib3.util.retry import RequestHistory, Retry
+from lxml import etree, html as lxml_html
+import io
+import json
 import re
 import logging
-from typing import List, Dict, Optional
-from urllib.parse import quote
+import socket
+import string
+import threading
+import time
+from typing import BinaryIO, Callable, List, Dict, Optional, Tuple, Union
+from urllib.parse import quote, urlsplit, urlunsplit
+from django.core.cache import cache
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib decoder
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -28,19 +45,384 @@ BGA_API_BASE = "https://api.boardgameatlas.com/api"
 BGA_CLIENT_ID = "JMc8dOwiQE"  # Public test key
 BOARDGAMEPRICES_API = "https://www.boardgameprices.co.uk/plugin/info"
 
+# Maximum number of ids per BGG thing API request
+BGG_THING_BATCH_SIZE = 20
+
+# BGG throttles aggressive clients, so requests to it are capped in flight and
+# per second (short bursts allowed)
+BGG_MAX_CONCURRENT_REQUESTS = 4
+BGG_REQUESTS_PER_SECOND = 2
+BGG_REQUEST_BURST = 4
+
+# How long the primary source of a lookup runs alone before the fallback
+# sources are started alongside it (seconds)
+FALLBACK_HEAD_START = 2
+
+# Longest Retry-After (seconds) honoured before retrying a 429/503, so a
+# throttling server cannot stall a lookup far beyond its request timeout
+RETRY_AFTER_MAX = 2
+
+# og:image lives in <head>, so thumbnail lookups only read the start of the page
+THUMBNAIL_SCAN_BYTES = 64 * 1024
+
+# GEEK.geekitemPreload sits in a <script> deep in <body>, so game page scrapes
+# need most of the page; this only bounds pathological responses
+SCRAPE_MAX_BYTES = 1024 * 1024
+
+# When a read stops early, a remainder of at most this many bytes (known from
+# Content-Length) is drained so the keep-alive connection returns to the pool;
+# larger or unknown-length remainders are cheaper to drop with the connection
+DRAIN_MAX_BYTES = 256 * 1024
+
+# Cache lifetimes (seconds)
+BGA_CACHE_TIMEOUT = 60 * 60
+BGG_DETAILS_CACHE_TIMEOUT = 60 * 60
+THUMBNAIL_CACHE_TIMEOUT = 60 * 60 * 24
+PRICES_CACHE_TIMEOUT = 60 * 60
+SEARCH_CACHE_TIMEOUT = 60 * 5
+# ETag/Last-Modified of scraped pages outlive the scrape itself, so an expired
+# scrape can be revalidated with a conditional request
+PAGE_VALIDATORS_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+
 # Exchange rate GBP to EUR
 GBP_TO_EUR = 1.17
 
+# Characters stripped from both ends of BoardGamePrices price strings: currency
+# symbols, currency codes and whitespace ("£12.99", "GBP 12.99", "12,99 €")
+CURRENCY_AFFIXES = '£$€ \t\xa0' + string.ascii_letters
+
 # HTTP headers to mimic a browser
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
     'Accept-Language': 'en-US,en;q=0.5',
-    'Accept-Encoding': 'gzip, deflate',
+    # Every encoding urllib3 can decode here (adds br when brotli is installed)
+    'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding'],
     'Connection': 'keep-alive',
     'Upgrade-Insecure-Requests': '1'
 }
 
+# User-Agent variants tried in turn against the BGG XML API (per-request
+# overrides of the session headers; the last is requests' own User-Agent)
+BGG_XML_HEADER_VARIANTS = (
+    {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'},
+    {'User-Agent': 'BGCatalog/1.0'},
+    {'User-Agent': requests.utils.default_user_agent()},
+)
+
+# TCP keepalive on pooled sockets, so idle connections are not silently dropped
+# by NAT/firewalls between lookups (which would force a new DNS + TLS setup)
+_KEEPALIVE_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+if hasattr(socket, 'TCP_KEEPIDLE'):
+    _KEEPALIVE_SOCKET_OPTIONS += [
+        (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 15),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 4),
+    ]
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled connections use TCP keepalive."""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault('socket_options', _KEEPALIVE_SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
+class _BoundedRetry(Retry):
+    """Retry policy that waits at most RETRY_AFTER_MAX seconds for Retry-After."""
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, RETRY_AFTER_MAX)
+
+
+class _TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until a request may be sent."""
+    
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Take the token now, even if that goes negative, and sleep off the debt
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+class _RateLimitedAdapter(_KeepAliveAdapter):
+    """
+    Keepalive adapter that bounds concurrent requests and request rate.
+    
+    Retries run here instead of inside urllib3, so every attempt takes a
+    rate-limit token and no concurrency slot is held while backing off.
+    """
+    
+    def __init__(self, max_concurrent: int, bucket: _TokenBucket, max_retries: Retry, **kwargs):
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._bucket = bucket
+        self._retry = max_retries
+        super().__init__(max_retries=0, **kwargs)
+    
+    def send(self, request, **kwargs):
+        retry = self._retry
+        while True:
+            response = error = None
+            with self._slots:
+                self._bucket.acquire()
+                try:
+                    response = super().send(request, **kwargs)
+                except requests.exceptions.SSLError:
+                    raise
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    error = e
+            
+            if error is not None:
+                retryable = retry.allowed_methods is None or request.method in retry.allowed_methods
+            else:
+                retryable = retry.is_retry(
+                    request.method, response.status_code, 'Retry-After' in response.headers
+                )
+            if not (retry.total and retryable):
+                if error is not None:
+                    raise error
+                return response
+            
+            retry = retry.new(
+                total=retry.total - 1,
+                history=retry.history + (RequestHistory(
+                    request.method, request.url, error,
+                    response.status_code if response is not None else None, None,
+                ),),
+            )
+            delay = retry.get_backoff_time()
+            if response is not None:
+                if retry.respect_retry_after_header:
+                    delay = retry.get_retry_after(response) or delay
+                response.close()
+            logger.debug("Retrying %s in %.1fs", request.url, delay)
+            time.sleep(delay)
+
+
+def _build_session() -> requests.Session:
+    """Build an HTTP session with browser headers, pooled keepalive connections and retries."""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter_kwargs = {
+        'pool_connections': 10,
+        'pool_maxsize': 20,
+        'max_retries': _BoundedRetry(
+            total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,
+        ),
+    }
+    adapter = _KeepAliveAdapter(**adapter_kwargs)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    
+    # Longest prefix wins, so every BGG request goes through the limiter
+    session.mount(f"{BGG_WEB_BASE}/", _RateLimitedAdapter(
+        BGG_MAX_CONCURRENT_REQUESTS,
+        _TokenBucket(BGG_REQUESTS_PER_SECOND, BGG_REQUEST_BURST),
+        **adapter_kwargs,
+    ))
+    return session
+
+
+# Shared HTTP session: sends HEADERS by default, keeps connections alive
+# between calls to the same host and retries rate limiting (429, honouring a
+# capped Retry-After) and transient server errors with a short backoff; once
+# retries run out the last response is returned rather than raised
+_SESSION = _build_session()
+
+# XML parsing: entities are not expanded and nothing is fetched over the network
+_XML_PARSER = etree.XMLParser(resolve_entities=False, no_network=True)
+
+# Compiled XPath expressions for BGG XML API responses
+_XP_ITEMS = etree.XPath('//item')
+_XP_PRIMARY_NAME = etree.XPath('string(.//name[@type="primary"]/@value)')
+# Overall board game rank; the other <rank> entries are per-family ranks
+_XP_BOARDGAME_RANK = etree.XPath('string(ranks/rank[@type="subtype"][@name="boardgame"]/@value)')
+
+# Thing API <item> children read in a single pass, mapped to game_data keys
+_THING_INT_FIELDS = {
+    'yearpublished': 'year_published',
+    'minplayers': 'min_players',
+    'maxplayers': 'max_players',
+    'minplaytime': 'min_playtime',
+    'maxplaytime': 'max_playtime',
+    'minage': 'min_age',
+}
+_THING_TEXT_FIELDS = {
+    'image': 'image_url',
+    'thumbnail': 'thumbnail_url',
+    'description': 'description',
+}
+_THING_LINK_TYPES = ('boardgamedesigner', 'boardgamecategory', 'boardgamemechanic')
+
+# Compiled XPath expressions for scraped BGG pages
+# (the thumbnail scrape needs only og:image, so it skips the full meta walk)
+_XP_OG_IMAGE = etree.XPath('string(//meta[@property="og:image"][1]/@content)')
+_XP_HEADER_IMAGE = etree.XPath(
+    'string((//img[contains(concat(" ", normalize-space(@class), " "), " game-header-image ")'
+    ' or contains(@alt, "game")])[1]/@src)'
+)
+_XP_META_PROPERTIES = etree.XPath('//meta[@property]')
+_XP_GAME_NAME = etree.XPath(
+    '(//h1[contains(concat(" ", normalize-space(@class), " "), " game-header-title-info ")]//a'
+    ' | //h1//a[contains(@href, "/boardgame/")])[1]'
+)
+_XP_TITLE = etree.XPath('string(//title[1])')
+_XP_H1 = etree.XPath('string(//h1[1])')
+_XP_DESCRIPTION = etree.XPath(
+    '(//div[contains(concat(" ", normalize-space(@class), " "), " game-description-body ")]'
+    ' | //div[contains(@class, "description")] | //p[contains(@class, "description")])[1]'
+)
+_XP_DESIGNER = etree.XPath('(//a[contains(@href, "/boardgamedesigner/")])[1]')
+_XP_RATING = etree.XPath(
+    '(//span[contains(concat(" ", normalize-space(@class), " "), " rating-value ")]'
+    ' | //div[contains(@class, "rating")])[1]'
+)
+_XP_RANK = etree.XPath('(//span[contains(@class, "rank")] | //div[contains(@class, "rank")])[1]')
+_XP_PAGE_TEXT = etree.XPath('//text()[not(ancestor::script or ancestor::style)]')
+_XP_SEARCH_ROWS = etree.XPath('//tr[starts-with(@id, "row_")]')
+_XP_PRIMARY_LINK = etree.XPath('(.//a[contains(concat(" ", normalize-space(@class), " "), " primary ")])[1]')
+_XP_COLLECTION_YEAR = etree.XPath(
+    'string((.//*[contains(concat(" ", normalize-space(@class), " "), " collection_year ")])[1])'
+)
+
+# Compiled patterns used while scraping
+_RE_BGG_ID = re.compile(r'/boardgame/(\d+)/')
+_RE_YEAR4 = re.compile(r'\d{4}')
+_GEEK_PRELOAD_MARKER = b'GEEK.geekitemPreload'
+# Structural tokens of the preload object: whole JSON strings (so braces inside
+# them are skipped) and the braces themselves. A string cut off by a truncated
+# read runs to the end of the content, so its braces are never counted
+_RE_JSON_BRACE_TOKEN = re.compile(rb'"(?:[^"\\]|\\.)*(?:"|\\?\Z)|[{}]', re.DOTALL)
+_RE_PAREN_YEAR = re.compile(r'\((\d{4})\)')
+# En/em dashes and minus signs in page text are folded to '-' before matching
+_DASH_TABLE = str.maketrans({'\u2013': '-', '\u2014': '-', '\u2212': '-'})
+# Single-pass patterns: "2-4 Players" or "2 Players", "60-120 Min" or "30 Min",
+# "Age: 10+" or "10+ years"
+_RE_PLAYERS = re.compile(r'(?P<min>\d+)(?:-(?P<max>\d+))?\s+(?:Players?|player)', re.IGNORECASE)
+_RE_PLAYTIME = re.compile(r'(?P<min>\d+)(?:-(?P<max>\d+))?\s+(?:Min|Minutes?)', re.IGNORECASE)
+_RE_AGE = re.compile(r'(?:Age|Ages?):\s*(?P<label>\d+)\+|(?P<suffix>\d+)\+\s+(?:yrs|years?)', re.IGNORECASE)
+_RE_RATING = re.compile(r'(\d+\.\d+)')
+_RE_RANK = re.compile(r'#(\d+)')
+
+# Worker pool for independent network lookups (e.g. thumbnails for a result list)
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='bgg')
+
+
+def _cached(key: str, timeout: int, fetch: Callable, refresh: bool = False):
+    """
+    Return a cached API result, calling fetch() on a miss.
+    
+    Empty results (failed lookups) are not cached so the next call retries.
+    Cache backend errors are logged and the lookup goes to the network.
+    With refresh=True the cache is skipped and overwritten with a fresh result.
+    """
+    if not refresh:
+        result = _cache_get_many([key]).get(key)
+        if result is not None:
+            return result
+    
+    result = fetch()
+    if result:
+        _cache_set_many({key: result}, timeout)
+    return result
+
+
+def _cache_get_many(keys: List[str]) -> Dict:
+    """cache.get_many() that treats an unreachable cache backend as all misses."""
+    try:
+        return cache.get_many(keys)
+    except Exception as e:
+        logger.warning("Cache read failed: %s", e)
+        return {}
+
+
+def _cache_set_many(data: Dict, timeout: int) -> None:
+    """cache.set_many() that logs and ignores cache backend errors."""
+    if not data:
+        return
+    try:
+        cache.set_many(data, timeout)
+    except Exception as e:
+        logger.warning("Cache write failed: %s", e)
+
+
+def _json_loads(data):
+    """Decode JSON from bytes or str, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _first_result(lookups: List[tuple], accept: Callable = bool, head_start: float = FALLBACK_HEAD_START):
+    """
+    Return the first accepted result of several lookups, in priority order.
+    
+    Each lookup is a (label, function, *args) tuple. The first lookup runs
+    alone; the fallbacks are started (concurrently) only once it fails or has
+    not finished within head_start seconds. Results are checked in the order
+    given, so an earlier lookup wins even if a later one finishes first.
+    Lookups that have not started yet are cancelled once a result is accepted.
+    
+    Returns:
+        (label, result) for the accepted lookup, or (None, last result)
+    """
+    (label, fn, *args), fallbacks = lookups[0], lookups[1:]
+    primary = _EXECUTOR.submit(fn, *args)
+    submitted = [primary]
+    try:
+        pending = [(label, primary)]
+        if wait([primary], timeout=head_start).done:
+            accepted, result = _accepted_result(label, primary, accept)
+            if accepted:
+                return label, result
+            pending = []
+        
+        for label, fn, *args in fallbacks:
+            future = _EXECUTOR.submit(fn, *args)
+            submitted.append(future)
+            pending.append((label, future))
+        
+        for label, future in pending:
+            accepted, result = _accepted_result(label, future, accept)
+            if accepted:
+                return label, result
+    finally:
+        for future in submitted:
+            future.cancel()
+    return None, result
+
+
+def _accepted_result(label: str, future: Future, accept: Callable) -> tuple:
+    """Wait for a lookup and return (accepted, result), logging failures."""
+    try:
+        result = future.result()
+    except Exception:
+        logger.exception("%s lookup failed", label)
+        return False, None
+    if accept(result):
+        return True, result
+    logger.warning("%s returned no usable result", label)
+    return False, result
+
 
 def search_bgg_games(query: str, exact: bool = False) -> List[Dict]:
     """
@@ -53,87 +435,96 @@ def search_bgg_games(query: str, exact: bool = False) -> List[Dict]:
     Returns:
         List of games with bgg_id, name, year, thumbnail
     """
-    logger.info(f"Searching for games: '{query}' (exact={exact})")
-    
-    # Try BGG XML API first
-    games = _search_bgg_xml_api(query, exact)
-    if games:
-        logger.info(f"BGG XML API returned {len(games)} results")
-        return games
-    
-    # Fallback to Board Game Atlas
-    logger.warning("BGG XML API failed, trying Board Game Atlas")
-    games = _search_bga_api(query)
-    if games:
-        logger.info(f"Board Game Atlas returned {len(games)} results")
+    logger.info("Searching for games: '%s' (exact=%s)", query, exact)
+    return _cached(
+        f"bgg:search:{int(exact)}:{quote(query)}", SEARCH_CACHE_TIMEOUT,
+        lambda: _search_bgg_games(query, exact),
+    )
+
+
+def _search_bgg_games(query: str, exact: bool) -> List[Dict]:
+    """Run a search against the backends, skipping the result cache."""
+    # An exact BGG search is authoritative (this is the barcode path); the
+    # fuzzy fallbacks cannot find what it did not, so skip their round trips
+    if exact:
+        games = _search_bgg_xml_api(query, exact)
+        if not games:
+            logger.debug("No exact BGG match for query: %s", query)
         return games
     
-    # Fallback to web scraping
-    logger.warning("Board Game Atlas failed, trying web scraping")
-    games = _search_bgg_web_scraping(query)
-    if games:
-        logger.info(f"Web scraping returned {len(games)} results")
+    # The XML API gets a head start; BGA and the web search are only queried
+    # when it fails or is slow, and results are taken in priority order
+    source, games = _first_result([
+        ('BGG XML API', _search_bgg_xml_api, query, exact),
+        ('Board Game Atlas', _search_bga_api, query),
+        ('Web scraping', _search_bgg_web_scraping, query),
+    ])
+    if source:
+        logger.info("%s returned %d results", source, len(games))
         return games
     
-    logger.error(f"All search methods failed for query: {query}")
+    logger.error("All search methods failed for query: %s", query)
     return []
 
 
 def _search_bgg_xml_api(query: str, exact: bool = False) -> List[Dict]:
     """Search BGG XML API2 with retry strategies."""
-    headers_variants = [
-        {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'},
-        {'User-Agent': 'BGCatalog/1.0'},
-        {},
-    ]
-    
-    for attempt, headers in enumerate(headers_variants, 1):
+    for attempt, headers in enumerate(BGG_XML_HEADER_VARIANTS, 1):
         try:
             params = {'query': query, 'type': 'boardgame'}
             if exact:
                 params['exact'] = '1'
             
-            logger.debug(f"BGG XML API attempt {attempt} with headers: {headers}")
-            response = requests.get(BGG_SEARCH_URL, params=params, headers=headers, timeout=10)
+            logger.debug("BGG XML API attempt %s with headers: %s", attempt, headers)
+            response = _SESSION.get(BGG_SEARCH_URL, params=params, headers=headers, timeout=10)
             
             if response.status_code == 200:
-                return _parse_bgg_search_results(response.text)
-            else:
-                logger.warning(f"BGG XML API attempt {attempt} failed: {response.status_code}")
+                return _parse_bgg_search_results(response.content)
+            logger.warning("BGG XML API attempt %s failed: %s", attempt, response.status_code)
+            
+            # Throttled or unavailable: another User-Agent will not help and
+            # would only send BGG more requests
+            if response.status_code in (429, 503):
+                break
         except Exception as e:
-            logger.error(f"BGG XML API attempt {attempt} error: {str(e)}")
+            logger.error("BGG XML API attempt %s error: %s", attempt, e)
     
     return []
 
 
-def _parse_bgg_search_results(xml_text: str) -> List[Dict]:
+def _parse_bgg_search_results(xml_content: bytes) -> List[Dict]:
     """Parse BGG XML search results."""
     try:
-        root = ET.fromstring(xml_text)
+        root = etree.fromstring(xml_content, _XML_PARSER)
         games = []
         
-        for item in root.findall('.//item'):
+        for item in _XP_ITEMS(root):
             game_id = item.get('id')
-            name_elem = item.find('.//name[@type="primary"]')
+            name = _XP_PRIMARY_NAME(item)
             year_elem = item.find('yearpublished')
             
-            if name_elem is not None and game_id:
+            if name and game_id:
                 game = {
                     'bgg_id': game_id,
-                    'name': name_elem.get('value', ''),
-                    'year': int(year_elem.get('value', 0)) if year_elem is not None else None,
+                    'name': name,
+                    'year': _int_value(year_elem) if year_elem is not None else None,
                     'thumbnail': '',  # Will be fetched in detail view
                 }
                 games.append(game)
         
         return games
     except Exception as e:
-        logger.error(f"Error parsing BGG XML: {str(e)}")
+        logger.error("Error parsing BGG XML: %s", e)
         return []
 
 
 def _search_bga_api(query: str) -> List[Dict]:
-    """Search Board Game Atlas API."""
+    """Search Board Game Atlas API (cached per query)."""
+    return _cached(f"bga:search:{quote(query)}", BGA_CACHE_TIMEOUT, lambda: _fetch_bga_search(query))
+
+
+def _fetch_bga_search(query: str) -> List[Dict]:
+    """Fetch search results from Board Game Atlas API."""
     try:
         params = {
             'name': query,
@@ -142,10 +533,10 @@ def _search_bga_api(query: str) -> List[Dict]:
             'limit': 10,
         }
         
-        response = requests.get(f"{BGA_API_BASE}/search", params=params, timeout=10)
+        response = _SESSION.get(f"{BGA_API_BASE}/search", params=params, timeout=10)
         
         if response.status_code == 200:
-            data = response.json()
+            data = _json_loads(response.content)
             games = []
             
             for game in data.get('games', []):
@@ -158,54 +549,49 @@ def _search_bga_api(query: str) -> List[Dict]:
             
             return games
         else:
-            logger.error(f"BGA API error: {response.status_code}")
+            logger.error("BGA API error: %s", response.status_code)
     except Exception as e:
-        logger.error(f"BGA API exception: {str(e)}")
+        logger.error("BGA API exception: %s", e)
     
     return []
 
 
 def _search_bgg_web_scraping(query: str) -> List[Dict]:
     """Scrape BGG website for search results."""
-    import warnings
-    warnings.filterwarnings('ignore', message='Unverified HTTPS request')
-    
     try:
         search_url = f"{BGG_WEB_BASE}/geeksearch.php"
         params = {'action': 'search', 'objecttype': 'boardgame', 'q': query}
         
-        response = requests.get(search_url, params=params, headers=HEADERS, timeout=15, verify=False)
+        response = _SESSION.get(search_url, params=params, timeout=15)
         
         if response.status_code != 200:
-            logger.error(f"BGG web scraping failed: {response.status_code}")
+            logger.error("BGG web scraping failed: %s", response.status_code)
             return []
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        tree = _html_tree(response.content, _declared_charset(response))
         games = []
         
         # Find game links in search results
-        for row in soup.select('tr[id^="row_"]'):
+        for row in _XP_SEARCH_ROWS(tree):
             try:
-                link = row.select_one('a.primary')
-                if not link:
+                links = _XP_PRIMARY_LINK(row)
+                if not links:
                     continue
+                link = links[0]
                 
                 href = link.get('href', '')
-                match = re.search(r'/boardgame/(\d+)/', href)
+                match = _RE_BGG_ID.search(href)
                 if not match:
                     continue
                 
                 game_id = match.group(1)
-                name = link.get_text(strip=True)
+                name = link.text_content().strip()
                 
                 # Try to extract year
-                year_elem = row.select_one('.collection_year')
                 year = None
-                if year_elem:
-                    year_text = year_elem.get_text(strip=True)
-                    year_match = re.search(r'\d{4}', year_text)
-                    if year_match:
-                        year = int(year_match.group())
+                year_match = _RE_YEAR4.search(_XP_COLLECTION_YEAR(row))
+                if year_match:
+                    year = int(year_match.group())
                 
                 if name:
                     games.append({
@@ -215,210 +601,413 @@ def _search_bgg_web_scraping(query: str) -> List[Dict]:
                         'thumbnail': '',
                     })
             except Exception as e:
-                logger.warning(f"Error parsing search result row: {str(e)}")
+                logger.warning("Error parsing search result row: %s", e)
                 continue
         
         return games
     except Exception as e:
-        logger.error(f"BGG web scraping exception: {str(e)}")
+        logger.error("BGG web scraping exception: %s", e)
         return []
 
 
-def get_bgg_game_details(bgg_id: str) -> Dict:
+def get_bgg_game_details(bgg_id: str, refresh: bool = False) -> Dict:
     """
     Get detailed game information.
     
     Args:
         bgg_id: BGG ID or BGA ID (prefixed with 'bga_')
+        refresh: If True, bypass cached responses and fetch fresh data
         
     Returns:
-        Dictionary with complete game data
+        Dictionary with complete game data. When every source fails, the last
+        successful result is returned with 'stale': True.
     """
-    logger.info(f"Fetching game details for: {bgg_id}")
+    logger.info("Fetching game details for: %s", bgg_id)
     
     # Check if this is a BGA ID
     if bgg_id.startswith('bga_'):
         bga_id = bgg_id[4:]  # Remove 'bga_' prefix
-        return get_bga_game_details(bga_id)
+        return get_bga_game_details(bga_id, refresh)
     
-    # Try BGG XML API first
-    try:
-        logger.info(f"Trying BGG XML API for {bgg_id}")
-        game_data = _get_bgg_xml_details(bgg_id)
-        if game_data and game_data.get('name'):
-            logger.info(f"BGG XML API SUCCESS: {game_data.get('name')}")
-            return game_data
-        logger.warning(f"BGG XML API returned empty or no name for {bgg_id}")
-    except Exception as e:
-        logger.error(f"BGG XML API exception: {e}")
+    # Prefer the XML API; the game page is only scraped when it returns no
+    # named game or is slow to answer
+    source, game_data = _first_result([
+        ('BGG XML API', _get_bgg_xml_details, bgg_id, refresh),
+        ('Web scraping', scrape_bgg_game_page, bgg_id, refresh),
+    ], accept=lambda data: bool(data and data.get('name')))
+    if source:
+        logger.info("%s SUCCESS: %s", source, game_data.get('name'))
+        return game_data
     
-    # Fallback to web scraping
-    try:
-        logger.warning(f"BGG XML API failed, trying web scraping for {bgg_id}")
-        game_data = scrape_bgg_game_page(bgg_id)
-        if game_data and game_data.get('name'):
-            logger.info(f"Web scraping SUCCESS: {game_data.get('name')}")
-            return game_data
-        logger.error(f"Web scraping returned empty or no name for {bgg_id}")
-    except Exception as e:
-        logger.error(f"Web scraping exception: {e}")
+    logger.error("All methods failed to fetch details for BGG ID: %s", bgg_id)
     
-    logger.error(f"All methods failed to fetch details for BGG ID: {bgg_id}")
+    # BGG is down or rate limiting: serve the last successful result, if any
+    key = _last_known_good_key(bgg_id)
+    last_known_good = _cache_get_many([key]).get(key)
+    if last_known_good:
+        logger.warning("Serving last known good details for BGG ID %s", bgg_id)
+        return {**last_known_good, 'stale': True}
     return {}
 
 
+def _last_known_good_key(bgg_id: str) -> str:
+    """Cache key for the last successfully fetched details of a game (kept without expiry)."""
+    return f"bgg:lkg:{quote(bgg_id)}"
+
+
+def _remember_last_known_good(bgg_id: str, game_data: Dict) -> Dict:
+    """Keep freshly fetched details as the game's last known good copy and return them."""
+    if game_data and game_data.get('name'):
+        _cache_set_many({_last_known_good_key(bgg_id): game_data}, None)
+    return game_data
+
+
+def get_game_details_with_prices(bgg_id: str, refresh: bool = False) -> Tuple[Dict, Dict]:
+    """
+    Get game details and pricing at the same time.
+    
+    The BoardGamePrices lookup runs alongside the details lookup, so the
+    combined latency is that of the slower of the two.
+    
+    Returns:
+        (game data, pricing) as returned by get_bgg_game_details and
+        fetch_boardgameprices
+    """
+    pricing = _EXECUTOR.submit(fetch_boardgameprices, bgg_id, refresh)
+    game_data = get_bgg_game_details(bgg_id, refresh)
+    return game_data, pricing.result()
+
+
 def fetch_bgg_thumbnail(bgg_id: str) -> str:
-    """Fetch thumbnail by scraping BGG game page since Thing API returns 401.
+    """Fetch a single game's thumbnail by scraping its BGG game page.
 
     Returns an empty string if not available or on error. Forces HTTPS for security.
+    Found thumbnails are cached for a day. For several games use
+    fetch_bgg_thumbnails, which asks the Thing API first and only scrapes the rest.
     """
-    import warnings
-    warnings.filterwarnings('ignore', message='Unverified HTTPS request')
-    
+    return _cached(_thumbnail_cache_key(bgg_id), THUMBNAIL_CACHE_TIMEOUT, lambda: _fetch_bgg_thumbnail(bgg_id))
+
+
+def _thumbnail_cache_key(bgg_id: str) -> str:
+    """Cache key for a game's thumbnail URL."""
+    return f"bgg:thumb:{quote(bgg_id)}"
+
+
+def _fetch_bgg_thumbnail(bgg_id: str) -> str:
+    """Scrape the thumbnail URL from the head of a BGG game page."""
     try:
         url = f"https://boardgamegeek.com/boardgame/{bgg_id}"
-        logger.info(f"Fetching thumbnail for BGG {bgg_id} from {url}")
-        response = requests.get(url, headers=HEADERS, timeout=8, verify=False)
-        logger.info(f"BGG page response: {response.status_code}")
-        if response.status_code != 200:
-            return ''
+        logger.debug("Fetching thumbnail for BGG %s from %s", bgg_id, url)
+        with _SESSION.get(url, timeout=8, stream=True) as response:
+            logger.debug("BGG page response: %s", response.status_code)
+            if response.status_code != 200:
+                return ''
+            page_head = _read_head(response, THUMBNAIL_SCAN_BYTES)
+            encoding = _declared_charset(response)
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        tree = _html_tree(page_head, encoding)
         
         # Try meta og:image first (most reliable)
-        meta_img = soup.select_one('meta[property="og:image"]')
-        if meta_img and meta_img.get('content'):
-            img_url = meta_img.get('content').strip()
-            if img_url.startswith('http://'):
-                img_url = 'https://' + img_url[7:]
-            logger.info(f"Found thumbnail via og:image: {img_url}")
+        img_url = _XP_OG_IMAGE(tree).strip()
+        if img_url:
+            img_url = _force_https(img_url)
+            logger.debug("Found thumbnail via og:image: %s", img_url)
             return img_url
         
         # Fallback to game header image
-        header_img = soup.select_one('img.game-header-image, img[alt*="game"]')
-        if header_img and header_img.get('src'):
-            img_url = header_img.get('src').strip()
-            if img_url.startswith('http://'):
-                img_url = 'https://' + img_url[7:]
-            logger.info(f"Found thumbnail via header img: {img_url}")
+        img_url = _XP_HEADER_IMAGE(tree).strip()
+        if img_url:
+            img_url = _force_https(img_url)
+            logger.debug("Found thumbnail via header img: %s", img_url)
             return img_url
         
-        logger.warning(f"No thumbnail found for BGG {bgg_id}")
+        logger.warning("No thumbnail found for BGG %s", bgg_id)
         return ''
-    except Exception as e:
-        try:
-            logger.error(f"Scraping thumbnail failed for {bgg_id}: {e}")
-        except:
-            pass
+    except requests.RequestException as e:
+        logger.warning("Fetching thumbnail failed for %s: %s", bgg_id, e)
         return ''
+    except Exception:
+        logger.exception("Scraping thumbnail failed for %s", bgg_id)
+        return ''
+
+
+def _force_https(url: str) -> str:
+    """Upgrade http:// and protocol-relative (//host/...) URLs to https."""
+    parts = urlsplit(url)
+    if parts.netloc and parts.scheme in ('http', ''):
+        return urlunsplit(parts._replace(scheme='https'))
+    return url
+
 
+def _declared_charset(response: requests.Response) -> Optional[str]:
+    """The charset named in the response's Content-Type header, if any."""
+    # requests falls back to ISO-8859-1 for text/* without a charset; that
+    # guess must not override a <meta charset> in the page itself
+    if 'charset=' in response.headers.get('Content-Type', '').lower():
+        return response.encoding
+    return None
+
+
+def _html_tree(content: bytes, encoding: Optional[str] = None):
+    """Parse HTML bytes, decoding them with the HTTP charset when one was declared."""
+    parser = None
+    if encoding:
+        try:
+            parser = lxml_html.HTMLParser(encoding=encoding)
+        except LookupError:
+            logger.debug("Ignoring unknown page charset %r", encoding)
+    return lxml_html.fromstring(content, parser=parser)
 
-def _get_bgg_xml_details(bgg_id: str) -> Dict:
+
+def _read_head(response: requests.Response, limit: int) -> bytes:
+    """Read up to limit bytes of a streamed response body."""
+    chunks = []
+    size = 0
+    for chunk in response.iter_content(chunk_size=limit):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            _release_connection(response)
+            break
+    return b''.join(chunks)
+
+
+def _release_connection(response: requests.Response) -> None:
+    """Drain a small unread remainder of a streamed body so its connection is reused."""
+    try:
+        remaining = int(response.headers['Content-Length']) - response.raw.tell()
+    except (KeyError, ValueError, AttributeError):
+        return
+    if remaining <= DRAIN_MAX_BYTES:
+        response.raw.drain_conn()
+        response.raw.release_conn()
+
+
+def fetch_bgg_thumbnails(bgg_ids: List[str]) -> Dict[str, str]:
+    """
+    Fetch thumbnails for several BGG games.
+    
+    Thumbnails come from batched thing API requests (up to
+    BGG_THING_BATCH_SIZE games per request); only games the API has no
+    thumbnail for fall back to concurrent page scrapes.
+    
+    Returns a mapping of bgg_id to thumbnail URL ('' when unavailable).
+    """
+    keys = {bgg_id: _thumbnail_cache_key(bgg_id) for bgg_id in dict.fromkeys(bgg_ids)}
+    cached = _cache_get_many(list(keys.values()))
+    thumbnails = {bgg_id: cached[key] for bgg_id, key in keys.items() if key in cached}
+    
+    missing = [bgg_id for bgg_id in keys if bgg_id not in thumbnails]
+    fetched = {}
+    if missing:
+        for bgg_id, data in _get_bgg_xml_details_batch(missing).items():
+            if bgg_id in keys and data.get('thumbnail_url'):
+                fetched[bgg_id] = _force_https(data['thumbnail_url'])
+    
+    unscraped = [bgg_id for bgg_id in missing if bgg_id not in fetched]
+    fetched.update(zip(unscraped, _EXECUTOR.map(_fetch_bgg_thumbnail, unscraped)))
+    _cache_set_many(
+        {keys[bgg_id]: thumb for bgg_id, thumb in fetched.items() if thumb},
+        THUMBNAIL_CACHE_TIMEOUT,
+    )
+    thumbnails.update(fetched)
+    return thumbnails
+
+
+def _get_bgg_xml_details(bgg_id: str, refresh: bool = False) -> Dict:
+    """Fetch game details from BGG XML API (cached per game)."""
+    return _cached(
+        f"bgg:thing:{quote(bgg_id)}", BGG_DETAILS_CACHE_TIMEOUT,
+        lambda: _remember_last_known_good(bgg_id, _fetch_bgg_xml_details(bgg_id)), refresh,
+    )
+
+
+def _fetch_bgg_xml_details(bgg_id: str) -> Dict:
     """Fetch game details from BGG XML API."""
     try:
         params = {'id': bgg_id, 'stats': '1'}
-        response = requests.get(BGG_THING_URL, params=params, headers=HEADERS, timeout=10)
-        
-        if response.status_code != 200:
-            logger.error(f"BGG XML details failed: {response.status_code}")
-            return {}
-        
-        return _parse_bgg_thing_xml(response.text)
+        with _SESSION.get(BGG_THING_URL, params=params, timeout=10, stream=True) as response:
+            if response.status_code != 200:
+                logger.error("BGG XML details failed: %s", response.status_code)
+                return {}
+            
+            return _parse_bgg_thing_xml(_raw_body(response))
     except Exception as e:
-        logger.error(f"BGG XML details exception: {str(e)}")
+        logger.error("BGG XML details exception: %s", e)
         return {}
 
 
-def _parse_bgg_thing_xml(xml_text: str) -> Dict:
-    """Parse BGG thing API XML response."""
+def _get_bgg_xml_details_batch(bgg_ids: List[str]) -> Dict[str, Dict]:
+    """
+    Fetch game details for several games from the BGG XML API.
+    
+    Ids already in the cache are not requested again; the rest are fetched
+    BGG_THING_BATCH_SIZE at a time in a single thing request per batch.
+    
+    Returns:
+        Mapping of bgg_id to game data for the games BGG returned
+    """
+    keys = {bgg_id: f"bgg:thing:{quote(bgg_id)}" for bgg_id in dict.fromkeys(bgg_ids)}
+    cached = _cache_get_many(list(keys.values()))
+    results = {bgg_id: cached[key] for bgg_id, key in keys.items() if key in cached}
+    missing = [bgg_id for bgg_id in keys if bgg_id not in results]
+    
+    for start in range(0, len(missing), BGG_THING_BATCH_SIZE):
+        batch = missing[start:start + BGG_THING_BATCH_SIZE]
+        try:
+            params = {'id': ','.join(batch), 'stats': '1'}
+            with _SESSION.get(BGG_THING_URL, params=params, timeout=10, stream=True) as response:
+                if response.status_code != 200:
+                    logger.error("BGG XML batch details failed: %s", response.status_code)
+                    continue
+                
+                fetched = _parse_bgg_thing_items(_raw_body(response))
+        except (requests.RequestException, Urllib3HTTPError) as e:
+            logger.error("BGG XML batch details exception: %s", e)
+            continue
+        
+        _cache_set_many(
+            {keys[bgg_id]: data for bgg_id, data in fetched.items() if bgg_id in keys and data},
+            BGG_DETAILS_CACHE_TIMEOUT,
+        )
+        results.update(fetched)
+    
+    return results
+
+
+def _int_value(elem) -> Optional[int]:
+    """Integer 'value' attribute of a BGG XML element (0 if absent, None if malformed)."""
+    value = elem.get('value', '0').strip()
+    if value.lstrip('-').isdigit():
+        return int(value)
+    return None
+
+
+def _float_value(elem) -> Optional[float]:
+    """Float 'value' attribute of a BGG XML element (0.0 if absent, None if malformed)."""
     try:
-        root = ET.fromstring(xml_text)
-        item = root.find('.//item[@type="boardgame"]')
-        
-        if item is None:
-            return {}
-        
-        # Extract basic info
-        name_elem = item.find('.//name[@type="primary"]')
-        year_elem = item.find('yearpublished')
-        image_elem = item.find('image')
-        thumbnail_elem = item.find('thumbnail')
-        description_elem = item.find('description')
-        
-        # Extract gameplay info
-        minplayers_elem = item.find('minplayers')
-        maxplayers_elem = item.find('maxplayers')
-        playingtime_elem = item.find('playingtime')
-        minplaytime_elem = item.find('minplaytime')
-        maxplaytime_elem = item.find('maxplaytime')
-        minage_elem = item.find('minage')
-        
-        # Extract designer
-        designers = []
-        for link in item.findall('.//link[@type="boardgamedesigner"]'):
-            designers.append(link.get('value', ''))
-        
-        # Extract categories
-        categories = []
-        for link in item.findall('.//link[@type="boardgamecategory"]'):
-            categories.append(link.get('value', ''))
-        
-        # Extract mechanics
-        mechanics = []
-        for link in item.findall('.//link[@type="boardgamemechanic"]'):
-            mechanics.append(link.get('value', ''))
+        return float(elem.get('value', 0))
+    except ValueError:
+        return None
+
+
+def _raw_body(response: requests.Response) -> BinaryIO:
+    """File-like body of a streamed response, decompressed as it is read."""
+    response.raw.decode_content = True
+    return response.raw
+
+
+def _parse_bgg_thing_xml(xml_content: Union[bytes, BinaryIO]) -> Dict:
+    """Parse BGG thing API XML response for a single game."""
+    return next(iter(_parse_bgg_thing_items(xml_content).values()), {})
+
+
+def _parse_bgg_thing_items(xml_content: Union[bytes, BinaryIO]) -> Dict[str, Dict]:
+    """
+    Parse every board game in a BGG thing API XML response, keyed by id.
+    
+    xml_content is the response bytes or a file-like body (such as a streamed
+    response's raw stream). Items are parsed incrementally and discarded once
+    read, so a large batch response is never held in memory as a whole.
+    """
+    if isinstance(xml_content, bytes):
+        xml_content = io.BytesIO(xml_content)
+    games = {}
+    try:
+        items = etree.iterparse(
+            xml_content, tag='item', resolve_entities=False, no_network=True
+        )
+        for _, item in items:
+            if item.get('type') == 'boardgame':
+                game_data = _parse_bgg_thing_item(item)
+                if game_data:
+                    games[item.get('id')] = game_data
+            
+            # Free the item and any already-processed siblings
+            item.clear()
+            while item.getprevious() is not None:
+                del item.getparent()[0]
+    except etree.XMLSyntaxError as e:
+        logger.error("Error parsing BGG thing XML: %s", e)
+    return games
+
+
+def _parse_bgg_thing_item(item) -> Dict:
+    """Extract game data from a single thing API <item> element."""
+    try:
+        game_data = {
+            'name': '',
+            'year_published': None,
+            'image_url': '',
+            'thumbnail_url': '',
+            'description': '',
+            'designer': '',
+            'min_players': None,
+            'max_players': None,
+            'min_playtime': None,
+            'max_playtime': None,
+            'min_age': None,
+            'categories': '',
+            'mechanics': '',
+            'rating_average': None,
+            'rating_bayes': None,
+            'rank_overall': None,
+            'num_ratings': None,
+        }
+        links = {link_type: [] for link_type in _THING_LINK_TYPES}
+        ratings = None
+        
+        # One pass over the direct children instead of a find() per field
+        for child in item:
+            tag = child.tag
+            if tag in _THING_INT_FIELDS:
+                game_data[_THING_INT_FIELDS[tag]] = _int_value(child)
+            elif tag in _THING_TEXT_FIELDS:
+                game_data[_THING_TEXT_FIELDS[tag]] = child.text or ''
+            elif tag == 'link':
+                values = links.get(child.get('type'))
+                if values is not None:
+                    values.append(child.get('value', ''))
+            elif tag == 'name':
+                if child.get('type') == 'primary' and not game_data['name']:
+                    game_data['name'] = child.get('value', '')
+            elif tag == 'statistics':
+                ratings = child.find('ratings')
+        
+        game_data['designer'] = ', '.join(links['boardgamedesigner'][:3])  # Limit to first 3
+        game_data['categories'] = ', '.join(links['boardgamecategory'][:5])  # Limit to first 5
+        game_data['mechanics'] = ', '.join(links['boardgamemechanic'][:5])
         
         # Extract ratings
-        ratings = item.find('.//statistics/ratings')
-        rating_avg = None
-        rating_bayes = None
-        rank = None
-        num_ratings = None
-        
         if ratings is not None:
-            avg_elem = ratings.find('average')
-            bayes_elem = ratings.find('bayesaverage')
-            num_elem = ratings.find('usersrated')
-            rank_elem = ratings.find('.//rank[@type="subtype"]')
+            for child in ratings:
+                tag = child.tag
+                if tag == 'average':
+                    game_data['rating_average'] = _float_value(child)
+                elif tag == 'bayesaverage':
+                    game_data['rating_bayes'] = _float_value(child)
+                elif tag == 'usersrated':
+                    game_data['num_ratings'] = _int_value(child)
             
-            if avg_elem is not None:
-                rating_avg = float(avg_elem.get('value', 0))
-            if bayes_elem is not None:
-                rating_bayes = float(bayes_elem.get('value', 0))
-            if num_elem is not None:
-                num_ratings = int(num_elem.get('value', 0))
-            if rank_elem is not None:
-                rank_value = rank_elem.get('value', 'Not Ranked')
-                if rank_value.isdigit():
-                    rank = int(rank_value)
-        
-        game_data = {
-            'name': name_elem.get('value', '') if name_elem is not None else '',
-            'year_published': int(year_elem.get('value', 0)) if year_elem is not None else None,
-            'image_url': image_elem.text if image_elem is not None else '',
-            'thumbnail_url': thumbnail_elem.text if thumbnail_elem is not None else '',
-            'description': description_elem.text if description_elem is not None else '',
-            'designer': ', '.join(designers[:3]),  # Limit to first 3
-            'min_players': int(minplayers_elem.get('value', 0)) if minplayers_elem is not None else None,
-            'max_players': int(maxplayers_elem.get('value', 0)) if maxplayers_elem is not None else None,
-            'min_playtime': int(minplaytime_elem.get('value', 0)) if minplaytime_elem is not None else None,
-            'max_playtime': int(maxplaytime_elem.get('value', 0)) if maxplaytime_elem is not None else None,
-            'min_age': int(minage_elem.get('value', 0)) if minage_elem is not None else None,
-            'categories': ', '.join(categories[:5]),  # Limit to first 5
-            'mechanics': ', '.join(mechanics[:5]),
-            'rating_average': rating_avg,
-            'rating_bayes': rating_bayes,
-            'rank_overall': rank,
-            'num_ratings': num_ratings,
-        }
+            rank_value = _XP_BOARDGAME_RANK(ratings)
+            if rank_value.isdigit():
+                game_data['rank_overall'] = int(rank_value)
         
         return game_data
     except Exception as e:
-        logger.error(f"Error parsing BGG thing XML: {str(e)}")
+        logger.error("Error parsing BGG thing XML: %s", e)
         return {}
 
 
-def get_bga_game_details(bga_id: str) -> Dict:
+def get_bga_game_details(bga_id: str, refresh: bool = False) -> Dict:
+    """Fetch game details from Board Game Atlas API and enrich with BGG scraping (cached)."""
+    return _cached(
+        f"bga:details:{quote(bga_id)}", BGA_CACHE_TIMEOUT,
+        lambda: _fetch_bga_game_details(bga_id), refresh,
+    )
+
+
+def _fetch_bga_game_details(bga_id: str) -> Dict:
     """Fetch game details from Board Game Atlas API and enrich with BGG scraping."""
     try:
         params = {
@@ -426,17 +1015,17 @@ def get_bga_game_details(bga_id: str) -> Dict:
             'client_id': BGA_CLIENT_ID,
         }
         
-        response = requests.get(f"{BGA_API_BASE}/search", params=params, timeout=10)
+        response = _SESSION.get(f"{BGA_API_BASE}/search", params=params, timeout=10)
         
         if response.status_code != 200:
-            logger.error(f"BGA details API error: {response.status_code}")
+            logger.error("BGA details API error: %s", response.status_code)
             return {}
         
-        data = response.json()
+        data = _json_loads(response.content)
         games = data.get('games', [])
         
         if not games:
-            logger.error(f"No game found for BGA ID: {bga_id}")
+            logger.error("No game found for BGA ID: %s", bga_id)
             return {}
         
         game = games[0]
@@ -470,18 +1059,18 @@ def get_bga_game_details(bga_id: str) -> Dict:
         
         # Enrich with BGG data if available
         # BGA sometimes includes BGG ID in external_links
-        logger.info("Attempting to enrich BGA data with BGG scraping")
+        logger.debug("Attempting to enrich BGA data with BGG scraping")
         bgg_id = None
         for link in game.get('official_url', '').split():
             if 'boardgamegeek.com/boardgame/' in link:
-                match = re.search(r'/boardgame/(\d+)/', link)
+                match = _RE_BGG_ID.search(link)
                 if match:
                     bgg_id = match.group(1)
                     break
         
         # If we found a BGG ID, enrich the data
         if bgg_id:
-            logger.info(f"Found BGG ID {bgg_id} from BGA data, enriching...")
+            logger.info("Found BGG ID %s from BGA data, enriching...", bgg_id)
             bgg_data = scrape_bgg_game_page(bgg_id)
             if bgg_data:
                 # Merge BGG data (BGG takes priority for missing fields)
@@ -491,48 +1080,91 @@ def get_bga_game_details(bga_id: str) -> Dict:
         
         return game_data
     except Exception as e:
-        logger.error(f"BGA details exception: {str(e)}")
+        logger.error("BGA details exception: %s", e)
         return {}
 
 
-def scrape_bgg_game_page(bgg_id: str) -> Dict:
+def scrape_bgg_game_page(bgg_id: str, refresh: bool = False) -> Dict:
     """
-    Comprehensive web scraping of BGG game page.
+    Comprehensive web scraping of BGG game page (cached per game).
     
     Args:
         bgg_id: BoardGameGeek game ID
+        refresh: If True, bypass the cache and scrape the page again
         
     Returns:
         Dictionary with extracted game data
     """
-    import warnings
-    warnings.filterwarnings('ignore', message='Unverified HTTPS request')
+    return _cached(
+        f"bgg:page:{quote(bgg_id)}", BGG_DETAILS_CACHE_TIMEOUT,
+        lambda: _remember_last_known_good(bgg_id, _scrape_bgg_game_page(bgg_id)), refresh,
+    )
+
+
+def _scrape_bgg_game_page(bgg_id: str) -> Dict:
+    """
+    Fetch and scrape a BGG game page.
+    
+    When an earlier scrape stored the page's ETag/Last-Modified, the request is
+    conditional and a 304 reuses that scrape's data without downloading the page.
+    """
+    url = f"{BGG_WEB_BASE}/boardgame/{bgg_id}"
+    logger.debug("Scraping BGG page: %s", url)
+    
+    validators_key = f"bgg:page-validators:{quote(bgg_id)}"
+    validators = _cache_get_many([validators_key]).get(validators_key)
+    conditional = {}
+    if validators:
+        if validators['etag']:
+            conditional['If-None-Match'] = validators['etag']
+        if validators['last_modified']:
+            conditional['If-Modified-Since'] = validators['last_modified']
     
     try:
-        url = f"{BGG_WEB_BASE}/boardgame/{bgg_id}"
-        logger.info(f"Scraping BGG page: {url}")
-        
-        response = requests.get(url, headers=HEADERS, timeout=15, verify=False)
-        
-        if response.status_code != 200:
-            logger.error(f"BGG page scraping failed: {response.status_code}")
-            return {}
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
+        with _SESSION.get(url, headers=conditional, timeout=15, stream=True) as response:
+            if response.status_code == 304 and validators:
+                logger.debug("BGG page %s not modified", bgg_id)
+                return validators['data']
+            if response.status_code != 200:
+                logger.error("BGG page scraping failed: %s", response.status_code)
+                return {}
+            page = _read_head(response, SCRAPE_MAX_BYTES)
+            encoding = _declared_charset(response)
+            etag = response.headers.get('ETag', '')
+            last_modified = response.headers.get('Last-Modified', '')
+    except requests.RequestException as e:
+        logger.error("BGG page scraping exception: %s", e)
+        return {}
+    
+    game_data = _parse_bgg_game_page(bgg_id, page, encoding)
+    if game_data and (etag or last_modified):
+        _cache_set_many(
+            {validators_key: {'etag': etag, 'last_modified': last_modified, 'data': game_data}},
+            PAGE_VALIDATORS_CACHE_TIMEOUT,
+        )
+    return game_data
+
+
+def _parse_bgg_game_page(bgg_id: str, page: bytes, encoding: Optional[str] = None) -> Dict:
+    """Scrape game data from a BGG game page, preferring the embedded GEEK.geekitemPreload data."""
+    try:
         game_data = {}
         
-        # Try to extract from GEEK.geekitemPreload JavaScript object (most reliable)
+        # Try to extract from GEEK.geekitemPreload JavaScript object (most reliable).
+        # This searches the raw bytes, so neither a decoded copy of the page nor
+        # an HTML tree is built when it succeeds.
         try:
-            script_pattern = r'GEEK\.geekitemPreload\s*=\s*({.*?});'
-            script_match = re.search(script_pattern, response.text, re.DOTALL)
-            if script_match:
-                import json
-                js_data = json.loads(script_match.group(1))
+            preload = _extract_geek_preload(page)
+            if preload:
+                js_data = _json_loads(preload)
                 item = js_data.get('item', {})
                 
                 if item:
-                    logger.info("Found GEEK.geekitemPreload data!")
-                    game_data['name'] = item.get('name', '')
+                    logger.debug("Found GEEK.geekitemPreload data")
+                    primary_name = item.get('primaryname')
+                    game_data['name'] = item.get('name') or (
+                        primary_name.get('name', '') if isinstance(primary_name, dict) else ''
+                    )
                     game_data['year_published'] = item.get('yearpublished')
                     game_data['image_url'] = item.get('imageid_', '')
                     game_data['thumbnail_url'] = item.get('imageid_thumbnail', '')
@@ -571,171 +1203,264 @@ def scrape_bgg_game_page(bgg_id: str) -> Dict:
                     if mechanics:
                         game_data['mechanics'] = ', '.join(mechanics[:5])
                     
-                    logger.info(f"Extracted from JS: {game_data.get('name')} ({game_data.get('year_published')}), players: {game_data.get('min_players')}-{game_data.get('max_players')}")
-                    
                     # If we got complete data from JS, return it
                     if game_data.get('name'):
+                        logger.info(
+                            "Scraped BGG %s from preload data: %s (%d fields)",
+                            bgg_id, game_data['name'], _count_filled(game_data),
+                        )
                         return game_data
         except Exception as e:
-            logger.warning(f"Failed to extract from JavaScript: {e}")
+            logger.warning("Failed to extract from JavaScript: %s", e)
         
         # Fallback to HTML parsing if JavaScript extraction failed
-        logger.info("Falling back to HTML parsing")
+        logger.debug("Falling back to HTML parsing")
+        tree = _html_tree(page, encoding)
         
-        # Extract game name - try multiple selectors
-        name_elem = soup.select_one('h1.game-header-title-info a, h1 a[href*="/boardgame/"], meta[property="og:title"]')
-        if name_elem:
-            if name_elem.name == 'meta':
-                game_data['name'] = name_elem.get('content', '').strip()
-            else:
-                game_data['name'] = name_elem.get_text(strip=True)
+        # Only fields the preload data did not supply are extracted below
+        
+        # All <meta property> tags, collected in one pass
+        metas = _meta_properties(tree)
+        
+        # Extract game name - og:title first, then the page heading link
+        if not game_data.get('name'):
+            name = metas.get('og:title', '').strip()
+            if not name:
+                name_elem = _XP_GAME_NAME(tree)
+                if name_elem:
+                    name = name_elem[0].text_content().strip()
+            if name:
+                game_data['name'] = name
         
         # If still no name, try from page title
         if not game_data.get('name'):
-            title_elem = soup.find('title')
-            if title_elem:
-                title_text = title_elem.get_text(strip=True)
+            title_text = _XP_TITLE(tree).strip()
+            if title_text:
                 # Extract game name from title like "CATAN | Board Game | BoardGameGeek"
                 if '|' in title_text:
                     game_data['name'] = title_text.split('|')[0].strip()
                 else:
                     game_data['name'] = title_text.strip()
         
-        logger.info(f"Extracted name: {game_data.get('name', 'NO NAME FOUND')}")
+        logger.debug("Extracted name: %s", game_data.get('name', 'NO NAME FOUND'))
         
         # Extract year from meta or text
-        year_elem = soup.select_one('meta[property="og:description"]')
-        if year_elem:
-            desc = year_elem.get('content', '')
-            year_match = re.search(r'\((\d{4})\)', desc)
+        og_description = metas.get('og:description', '')
+        if og_description and not game_data.get('year_published'):
+            year_match = _RE_PAREN_YEAR.search(og_description)
             if year_match:
                 game_data['year_published'] = int(year_match.group(1))
-                logger.info(f"Extracted year from meta: {game_data['year_published']}")
+                logger.debug("Extracted year from meta: %s", game_data['year_published'])
         
+        # The page heading usually reads "Name (YYYY)"; try it and the title
+        # before scanning the whole page text
         if not game_data.get('year_published'):
-            year_match = re.search(r'\((\d{4})\)', soup.get_text())
+            year_match = _RE_PAREN_YEAR.search(_XP_H1(tree)) or _RE_PAREN_YEAR.search(_XP_TITLE(tree))
             if year_match:
                 game_data['year_published'] = int(year_match.group(1))
-                logger.info(f"Extracted year from text: {game_data['year_published']}")
+                logger.debug("Extracted year from heading: %s", game_data['year_published'])
         
-        # Extract image from meta tags (most reliable)
-        image_elem = soup.select_one('meta[property="og:image"]')
-        if image_elem:
-            game_data['image_url'] = image_elem.get('content', '')
-            game_data['thumbnail_url'] = game_data['image_url']
-            logger.info(f"Extracted image from og:image")
+        # Visible page text (script/style contents excluded), only built when
+        # one of the text-based fields is still missing
+        text_fields = ('year_published', 'min_players', 'min_playtime', 'min_age')
+        if all(game_data.get(field) for field in text_fields):
+            text = ''
         else:
-            # Fallback to img tag
-            image_elem = soup.select_one('img.game-header-image, img[alt*="game"]')
-            if image_elem:
-                game_data['image_url'] = image_elem.get('src', '')
-                game_data['thumbnail_url'] = game_data['image_url']
-                logger.info(f"Extracted image from img tag")
+            text = ''.join(_XP_PAGE_TEXT(tree)).translate(_DASH_TABLE)
+        
+        if not game_data.get('year_published'):
+            year_match = _RE_PAREN_YEAR.search(text)
+            if year_match:
+                game_data['year_published'] = int(year_match.group(1))
+                logger.debug("Extracted year from text: %s", game_data['year_published'])
+        
+        # Extract image from meta tags (most reliable)
+        if not game_data.get('image_url'):
+            image_url = metas.get('og:image', '')
+            if image_url:
+                game_data['image_url'] = image_url
+                game_data['thumbnail_url'] = image_url
+                logger.debug("Extracted image from og:image")
+            else:
+                # Fallback to img tag
+                image_url = _XP_HEADER_IMAGE(tree)
+                if image_url:
+                    game_data['image_url'] = image_url
+                    game_data['thumbnail_url'] = image_url
+                    logger.debug("Extracted image from img tag")
         
         # Extract description from meta or div
-        desc_elem = soup.select_one('meta[property="og:description"]')
-        if desc_elem:
-            game_data['description'] = desc_elem.get('content', '')[:1000]
-            logger.info(f"Extracted description from meta ({len(game_data['description'])} chars)")
-        else:
-            desc_elem = soup.select_one('div.game-description-body, div[class*="description"], p[class*="description"]')
-            if desc_elem:
-                game_data['description'] = desc_elem.get_text(strip=True)[:1000]
-                logger.info(f"Extracted description from div ({len(game_data['description'])} chars)")
+        if not game_data.get('description'):
+            if og_description:
+                game_data['description'] = og_description[:1000]
+                logger.debug("Extracted description from meta (%s chars)", len(game_data['description']))
+            else:
+                desc_elem = _XP_DESCRIPTION(tree)
+                if desc_elem:
+                    game_data['description'] = desc_elem[0].text_content().strip()[:1000]
+                    logger.debug("Extracted description from div (%s chars)", len(game_data['description']))
         
         # Extract gameplay info using regex from page text
-        text = soup.get_text()
-        
-        # Players - try multiple patterns
-        players_match = re.search(r'(\d+)[-–—](\d+)\s+(?:Players?|player)', text, re.IGNORECASE)
-        if players_match:
-            game_data['min_players'] = int(players_match.group(1))
-            game_data['max_players'] = int(players_match.group(2))
-            logger.info(f"Extracted players: {game_data['min_players']}-{game_data['max_players']}")
-        else:
-            single_player_match = re.search(r'(\d+)\s+(?:Players?|player)', text, re.IGNORECASE)
-            if single_player_match:
-                game_data['min_players'] = int(single_player_match.group(1))
-                game_data['max_players'] = int(single_player_match.group(1))
-                logger.info(f"Extracted single player count: {game_data['min_players']}")
-        
-        # Playtime - try multiple patterns
-        time_match = re.search(r'(\d+)[-–—](\d+)\s+(?:Min|Minutes?)', text, re.IGNORECASE)
-        if time_match:
-            game_data['min_playtime'] = int(time_match.group(1))
-            game_data['max_playtime'] = int(time_match.group(2))
-            logger.info(f"Extracted playtime: {game_data['min_playtime']}-{game_data['max_playtime']}")
-        else:
-            single_time_match = re.search(r'(\d+)\s+(?:Min|Minutes?)', text, re.IGNORECASE)
-            if single_time_match:
-                game_data['min_playtime'] = int(single_time_match.group(1))
-                game_data['max_playtime'] = int(single_time_match.group(1))
-                logger.info(f"Extracted single playtime: {game_data['min_playtime']}")
-        
-        # Age - try multiple patterns
-        age_match = re.search(r'(?:Age|Ages?):\s*(\d+)\+', text, re.IGNORECASE)
-        if not age_match:
-            age_match = re.search(r'(\d+)\+\s+(?:yrs|years?)', text, re.IGNORECASE)
-        if age_match:
-            game_data['min_age'] = int(age_match.group(1))
-            logger.info(f"Extracted min age: {game_data['min_age']}")
+        # Players, e.g. "2-4 Players" or "2 Players"
+        if not (game_data.get('min_players') and game_data.get('max_players')):
+            players_match = _RE_PLAYERS.search(text)
+            if players_match:
+                game_data['min_players'] = int(players_match['min'])
+                game_data['max_players'] = int(players_match['max'] or players_match['min'])
+                logger.debug("Extracted players: %s-%s", game_data['min_players'], game_data['max_players'])
+        
+        # Playtime, e.g. "60-120 Min" or "30 Min"
+        if not game_data.get('min_playtime'):
+            time_match = _RE_PLAYTIME.search(text)
+            if time_match:
+                game_data['min_playtime'] = int(time_match['min'])
+                game_data['max_playtime'] = int(time_match['max'] or time_match['min'])
+                logger.debug("Extracted playtime: %s-%s", game_data['min_playtime'], game_data['max_playtime'])
+        
+        # Age, e.g. "Age: 10+" or "10+ years"
+        if not game_data.get('min_age'):
+            age_match = _RE_AGE.search(text)
+            if age_match:
+                game_data['min_age'] = int(age_match[age_match.lastgroup])
+                logger.debug("Extracted min age: %s", game_data['min_age'])
         
         # Extract designer
-        designer_elem = soup.select_one('a[href*="/boardgamedesigner/"]')
-        if designer_elem:
-            game_data['designer'] = designer_elem.get_text(strip=True)
-            logger.info(f"Extracted designer: {game_data['designer']}")
+        if not game_data.get('designer'):
+            designer_elem = _XP_DESIGNER(tree)
+            if designer_elem:
+                game_data['designer'] = designer_elem[0].text_content().strip()
+                logger.debug("Extracted designer: %s", game_data['designer'])
         
         # Extract rating
-        rating_elem = soup.select_one('span.rating-value, div[class*="rating"]')
-        if rating_elem:
-            rating_text = rating_elem.get_text(strip=True)
-            rating_match = re.search(r'(\d+\.\d+)', rating_text)
-            if rating_match:
-                game_data['rating_average'] = float(rating_match.group(1))
+        if not game_data.get('rating_average'):
+            rating_elem = _XP_RATING(tree)
+            if rating_elem:
+                rating_text = rating_elem[0].text_content()
+                rating_match = _RE_RATING.search(rating_text)
+                if rating_match:
+                    game_data['rating_average'] = float(rating_match.group(1))
         
         # Extract rank
-        rank_elem = soup.select_one('span[class*="rank"], div[class*="rank"]')
-        if rank_elem:
-            rank_text = rank_elem.get_text(strip=True)
-            rank_match = re.search(r'#(\d+)', rank_text)
-            if rank_match:
-                game_data['rank_overall'] = int(rank_match.group(1))
-        
-        logger.info(f"Scraped game data: {game_data.get('name', 'Unknown')}")
+        if not game_data.get('rank_overall'):
+            rank_elem = _XP_RANK(tree)
+            if rank_elem:
+                rank_text = rank_elem[0].text_content()
+                rank_match = _RE_RANK.search(rank_text)
+                if rank_match:
+                    game_data['rank_overall'] = int(rank_match.group(1))
+        
+        logger.info(
+            "Scraped BGG %s from HTML: %s (%d fields)",
+            bgg_id, game_data.get('name', 'Unknown'), _count_filled(game_data),
+        )
         return game_data
     except Exception as e:
-        logger.error(f"BGG page scraping exception: {str(e)}")
+        logger.error("BGG page parsing exception: %s", e)
         return {}
 
 
-def fetch_boardgameprices(bgg_id: str) -> Dict:
+def _meta_properties(tree) -> Dict[str, str]:
+    """Map each <meta property> on a page to its content (first occurrence wins)."""
+    metas = {}
+    for meta in _XP_META_PROPERTIES(tree):
+        metas.setdefault(meta.get('property'), meta.get('content', ''))
+    return metas
+
+
+def _count_filled(game_data: Dict) -> int:
+    """Number of fields in game_data that have a value."""
+    return sum(1 for value in game_data.values() if value)
+
+
+def _extract_geek_preload(content: bytes) -> Optional[bytes]:
+    """
+    Return the JSON object assigned to GEEK.geekitemPreload in a BGG page.
+    
+    The object's end is found by counting braces outside JSON strings, so only
+    the object itself is handed to the JSON decoder.
     """
-    Fetch pricing information from BoardGamePrices.co.uk.
+    marker = content.find(_GEEK_PRELOAD_MARKER)
+    if marker < 0:
+        return None
+    start = content.find(b'{', marker)
+    if start < 0 or content[marker + len(_GEEK_PRELOAD_MARKER):start].strip() != b'=':
+        return None
+    
+    depth = 0
+    for token in _RE_JSON_BRACE_TOKEN.finditer(content, start):
+        if token.group() == b'{':
+            depth += 1
+        elif token.group() == b'}':
+            depth -= 1
+            if depth == 0:
+                return content[start:token.end()]
+    return None
+
+
+def fetch_boardgameprices(bgg_id: str, refresh: bool = False) -> Dict:
+    """
+    Fetch pricing information from BoardGamePrices.co.uk (cached per game).
     
     Args:
         bgg_id: BoardGameGeek game ID
+        refresh: If True, bypass the cache and query the API again
         
     Returns:
         Dictionary with price, store, url, availability
     """
+    return _cached(_prices_cache_key(bgg_id), PRICES_CACHE_TIMEOUT, lambda: _fetch_boardgameprices(bgg_id), refresh)
+
+
+def _prices_cache_key(bgg_id: str) -> str:
+    """Cache key for a game's BoardGamePrices result."""
+    return f"bgp:prices:{quote(bgg_id)}"
+
+
+def _parse_price(value: Union[str, int, float, None]) -> Optional[float]:
+    """
+    Parse a price amount such as "£12.99", "12,99 €" or "£1,299.00".
+    
+    The last '.' or ',' is the decimal separator. Thousands separators (the
+    other character, between 3-digit groups) are only accepted before a
+    two-digit fraction, so "1.299" stays 1.299 while "1.299,00" is 1299.0.
+    """
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value or '').strip(CURRENCY_AFFIXES)
+    sep = max(text.rfind('.'), text.rfind(','))
+    if sep < 0:
+        whole, fraction = text, '0'
+    else:
+        whole, fraction = text[:sep], text[sep + 1:]
+        if len(fraction) == 2:
+            head, *groups = whole.split(',' if text[sep] == '.' else '.')
+            if any(len(group) != 3 for group in groups):
+                return None
+            whole = head + ''.join(groups)
+    if not (whole.isdecimal() and fraction.isdecimal()):
+        return None
+    return float(f"{whole}.{fraction}")
+
+
+def _fetch_boardgameprices(bgg_id: str) -> Dict:
+    """Fetch the lowest price for a game from the BoardGamePrices API."""
     try:
         # Skip if this is a BGA ID
         if bgg_id.startswith('bga_'):
-            logger.info("Skipping BoardGamePrices for BGA ID")
+            logger.debug("Skipping BoardGamePrices for BGA ID")
             return {}
         
         params = {'bggid': bgg_id}
-        response = requests.get(BOARDGAMEPRICES_API, params=params, timeout=10)
+        response = _SESSION.get(BOARDGAMEPRICES_API, params=params, timeout=10)
         
         if response.status_code != 200:
-            logger.error(f"BoardGamePrices API error: {response.status_code}")
+            logger.error("BoardGamePrices API error: %s", response.status_code)
             return {}
         
-        data = response.json()
+        data = _json_loads(response.content)
         
         if not data or 'prices' not in data:
-            logger.warning(f"No pricing data for BGG ID: {bgg_id}")
+            logger.warning("No pricing data for BGG ID: %s", bgg_id)
             return {}
         
         prices = data['prices']
@@ -749,13 +1474,11 @@ def fetch_boardgameprices(bgg_id: str) -> Dict:
         price_str = lowest.get('price', '0')
         currency = lowest.get('currency', 'GBP')
         
-        # Parse price
-        price_match = re.search(r'[\d.]+', price_str)
-        if not price_match:
+        price = _parse_price(price_str)
+        if price is None:
+            logger.warning("Unparseable BoardGamePrices price for %s: %r", bgg_id, price_str)
             return {}
         
-        price = float(price_match.group())
-        
         # Convert GBP to EUR if needed
         if currency == 'GBP':
             price = round(price * GBP_TO_EUR, 2)
@@ -767,5 +1490,5 @@ def fetch_boardgameprices(bgg_id: str) -> Dict:
             'availability': lowest.get('availability', ''),
         }
     except Exception as e:
-        logger.error(f"BoardGamePrices exception: {str(e)}")
+        logger.error("BoardGamePrices exception: %s", e)
         return {}
@@ -26,19 +26,24 @@ def bgg_search(request):
         # Search using the service
         games = bgg_price_service.search_bgg_games(search_query, exact=is_barcode)
 
-        # Populate thumbnails for results that lack them by fetching BGG thing thumbnail.
-        # This adds a few extra API calls but greatly improves UX in the admin search.
-        logger.info(f"Processing {len(games)} games to populate missing thumbnails")
+        # Populate thumbnails for results that lack them from batched BGG thing requests
+        # (page scrapes only for games the API has no thumbnail for). This adds a few
+        # extra API calls but greatly improves UX in the admin search.
+        missing = [
+            g['bgg_id'] for g in games
+            if not g.get('thumbnail') and g.get('bgg_id') and not g['bgg_id'].startswith('bga_')
+        ]
+        logger.info("Fetching %d missing thumbnails for %d games", len(missing), len(games))
+        try:
+            thumbnails = bgg_price_service.fetch_bgg_thumbnails(missing)
+        except Exception as e:
+            # Thumbnails are cosmetic: show the results without them
+            logger.warning("Failed to fetch thumbnails for search results: %s", e)
+            thumbnails = {}
         for g in games:
-            if not g.get('thumbnail') and g.get('bgg_id') and not g.get('bgg_id').startswith('bga_'):
-                try:
-                    thumb = bgg_price_service.fetch_bgg_thumbnail(g['bgg_id'])
-                    if thumb:
-                        g['thumbnail'] = thumb
-                        logger.info(f"Fetched thumbnail for BGG id {g.get('bgg_id')}: {thumb}")
-                except Exception as e:
-                    logger.warning(f"Failed to fetch thumbnail for {g.get('bgg_id')}: {e}")
-                    continue
+            thumb = thumbnails.get(g.get('bgg_id'))
+            if thumb:
+                g['thumbnail'] = thumb
     
     context = {
         'search_query': search_query,
@@ -58,17 +63,13 @@ def preview_bgg_game(request, bgg_id):
         return redirect('edit_game', game_id=existing_game.id)
     
     # Fetch complete game details from APIs
-    logger.info(f"Fetching complete details for BGG ID: {bgg_id}")
-    game_data = bgg_price_service.get_bgg_game_details(bgg_id)
+    logger.info("Fetching complete details for BGG ID: %s", bgg_id)
+    game_data, pricing = bgg_price_service.get_game_details_with_prices(bgg_id)
     
-    # If no data from main API, try scraping as fallback
+    # The details lookup already falls back to scraping the game page;
+    # if that found nothing either, create minimal entry
     if not game_data or not game_data.get('name'):
-        logger.warning(f"No data from BGG API for {bgg_id}, attempting web scraping")
-        game_data = bgg_price_service.scrape_bgg_game_page(bgg_id)
-    
-    # If still no data, create minimal entry
-    if not game_data or not game_data.get('name'):
-        logger.error(f"Failed to fetch any data for {bgg_id}")
+        logger.error("Failed to fetch any data for %s", bgg_id)
         thumb = bgg_price_service.fetch_bgg_thumbnail(bgg_id)
         game_data = {
             'name': f'BGG #{bgg_id}',
@@ -77,9 +78,10 @@ def preview_bgg_game(request, bgg_id):
             'description': '',
         }
         messages.warning(request, f'Could not fetch complete data for BGG ID {bgg_id}. Please fill in details manually.')
+    elif game_data.get('stale'):
+        messages.warning(request, 'BoardGameGeek is unavailable; showing the last details fetched for this game')
     
-    # Fetch pricing
-    pricing = bgg_price_service.fetch_boardgameprices(bgg_id)
+    # Pricing was fetched alongside the details
     if pricing:
         game_data['msrp_price'] = pricing.get('price')
     
@@ -142,13 +144,16 @@ def refresh_game_data(request, game_id):
         messages.error(request, 'Game has no BGG/BGA ID to refresh from')
         return redirect('edit_game', game_id=game_id)
     
-    # Fetch updated data
-    game_data = bgg_price_service.get_bgg_game_details(game.bgg_id)
+    # Fetch updated data and pricing, bypassing cached API responses
+    game_data, pricing = bgg_price_service.get_game_details_with_prices(game.bgg_id, refresh=True)
     
     if not game_data:
         messages.error(request, 'Failed to fetch updated game details')
         return redirect('edit_game', game_id=game_id)
     
+    if game_data.get('stale'):
+        messages.warning(request, 'BoardGameGeek is unavailable; using the last details fetched for this game')
+    
     # Update fields (preserve manual edits to certain fields)
     game.name = game_data.get('name', game.name)
     game.year_published = game_data.get('year_published') or game.year_published
@@ -169,7 +174,6 @@ def refresh_game_data(request, game_id):
     game.num_ratings = game_data.get('num_ratings') or game.num_ratings
     
     # Update pricing if available
-    pricing = bgg_price_service.fetch_boardgameprices(game.bgg_id)
     if pricing and not game.msrp_price:
         game.msrp_price = pricing.get('price')
     
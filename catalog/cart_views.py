@@ -2,15 +2,20 @@
 Shopping cart and checkout views.
 """
 
+import logging
+import smtplib
 from django.shortcuts import render, redirect, get_object_or_404
 from django.http import JsonResponse
 from django.contrib import messages
 from django.db import transaction
+from django.db.models import Sum
 from django.utils import timezone
 from django.core.mail import send_mail
 from django.conf import settings
 from .models import BoardGame, StockReservation
 
+logger = logging.getLogger(__name__)
+
 
 def get_cart(request):
     """Get cart from session."""
@@ -154,32 +159,51 @@ def checkout(request):
     # Create reservations atomically
     try:
         with transaction.atomic():
-            reservations = []
+            now = timezone.now()
             
+            # Lock every game in the cart and load active reservations in
+            # two queries, instead of two queries per cart line
+            games = BoardGame.objects.select_for_update().in_bulk([int(game_id) for game_id in cart])
+            reserved = dict(
+                StockReservation.objects.filter(
+                    game_id__in=games, status='active', expires_at__gt=now
+                ).values('game_id').annotate(total=Sum('quantity')).values_list('game_id', 'total')
+            )
+            
+            reservations = []
             for game_id, quantity in cart.items():
-                game = BoardGame.objects.select_for_update().get(id=game_id)
+                game = games.get(int(game_id))
+                if game is None:
+                    raise ValueError('A game in your cart is no longer available')
                 
                 # Validate stock
-                if quantity > game.available_quantity:
+                available = max(0, game.stock_quantity - reserved.get(game.id, 0))
+                if quantity > available:
                     raise ValueError(f'Insufficient stock for {game.name}')
                 
-                # Create reservation
-                reservation = StockReservation.objects.create(
+                reservations.append(StockReservation(
                     game=game,
                     quantity=quantity,
                     customer_name=customer_name,
                     customer_email=customer_email,
                     customer_phone=customer_phone,
                     session_key=session_key,
-                )
-                reservations.append(reservation)
+                    expires_at=now + StockReservation.RESERVATION_DURATION,
+                ))
+            
+            # Create all reservations in a single INSERT
+            StockReservation.objects.bulk_create(reservations)
             
             # Clear cart
             request.session['cart'] = {}
             request.session.modified = True
             
-            # Send quote email
-            _send_quote_email(customer_email, customer_name, reservations)
+            # Send quote email once the reservations are committed, so SMTP
+            # latency never holds the row locks taken above
+            transaction.on_commit(
+                lambda: _send_quote_email(customer_email, customer_name, reservations),
+                robust=True,
+            )
             
             messages.success(request, 'Quote request sent! Stock reserved for 30 minutes.')
             return redirect('checkout_success')
@@ -198,15 +222,16 @@ def checkout_success(request):
 
 
 def _send_quote_email(customer_email, customer_name, reservations):
-    """Send quote email to customer."""
-    total = sum(r.game.final_price * r.quantity for r in reservations if r.game.final_price)
-    
-    items_text = '\n'.join([
-        f"- {r.game.name} x {r.quantity} @ €{r.game.final_price} = €{r.game.final_price * r.quantity}"
-        for r in reservations
-    ])
-    
-    message = f"""
+    """Send quote email to customer (runs after the checkout transaction commits)."""
+    try:
+        total = sum(r.game.final_price * r.quantity for r in reservations if r.game.final_price)
+        
+        items_text = '\n'.join([
+            f"- {r.game.name} x {r.quantity} @ €{r.game.final_price} = €{r.game.final_price * r.quantity}"
+            for r in reservations
+        ])
+        
+        message = f"""
     Dear {customer_name},
     
     Thank you for your interest in our board games!
@@ -222,8 +247,7 @@ def _send_quote_email(customer_email, customer_name, reservations):
     Best regards,
     BG Catalog Team
     """
-    
-    try:
+        
         send_mail(
             subject='Your Board Game Quote',
             message=message,
@@ -231,6 +255,6 @@ def _send_quote_email(customer_email, customer_name, reservations):
             recipient_list=[customer_email],
             fail_silently=False,
         )
-    except Exception as e:
+    except (smtplib.SMTPException, OSError) as e:
         # Log error but don't fail checkout
-        print(f"Failed to send email: {e}")
+        logger.warning("Failed to send quote email to %s: %s", customer_email, e)
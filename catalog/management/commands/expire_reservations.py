@@ -0,0 +1,17 @@
+"""
+Expire stock reservations whose hold time has elapsed.
+
+Intended to run on a schedule (cron, Fly.io scheduled machine, etc.):
+    python manage.py expire_reservations
+"""
+
+from django.core.management.base import BaseCommand
+from catalog.models import StockReservation
+
+
+class Command(BaseCommand):
+    help = 'Mark active reservations past their expiry time as expired'
+
+    def handle(self, *args, **options):
+        count = StockReservation.expire_old_reservations()
+        self.stdout.write(f'Expired {count} reservation(s)')
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-10-15 22:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='boardgame',
+            name='catalog_boa_is_sold_34df02_idx',
+        ),
+        migrations.AddIndex(
+            model_name='boardgame',
+            index=models.Index(fields=['is_sold', '-created_at'], name='catalog_boa_is_sold_381f73_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='boardgame',
+            index=models.Index(fields=['condition', 'is_sold'], name='catalog_boa_conditi_0ddbc2_idx'),
+        ),
+    ]
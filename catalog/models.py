@@ -88,7 +88,9 @@ class BoardGame(models.Model):
             models.Index(fields=['bgg_id']),
             models.Index(fields=['name']),
             models.Index(fields=['created_at']),
-            models.Index(fields=['is_sold']),
+            # Unsold games newest first (public catalog and admin panel listings)
+            models.Index(fields=['is_sold', '-created_at']),
+            models.Index(fields=['condition', 'is_sold']),
         ]
     
     def __str__(self):
@@ -163,6 +165,9 @@ class StockReservation(models.Model):
         ('expired', 'Expired'),
     ]
     
+    # How long a new reservation holds stock
+    RESERVATION_DURATION = timedelta(minutes=30)
+    
     # Reservation Details
     game = models.ForeignKey(
         BoardGame,
@@ -209,7 +214,7 @@ class StockReservation(models.Model):
     def save(self, *args, **kwargs):
         """Set expiry time on creation."""
         if not self.pk and not self.expires_at:
-            self.expires_at = timezone.now() + timedelta(minutes=30)
+            self.expires_at = timezone.now() + self.RESERVATION_DURATION
         super().save(*args, **kwargs)
     
     @property
@@ -259,11 +264,8 @@ class StockReservation(models.Model):
     
     @classmethod
     def expire_old_reservations(cls):
-        """Class method to expire old reservations."""
-        expired = cls.objects.filter(
+        """Class method to expire old reservations (single UPDATE, returns row count)."""
+        return cls.objects.filter(
             status='active',
             expires_at__lt=timezone.now()
-        )
-        count = expired.count()
-        expired.update(status='expired')
-        return count
+        ).update(status='expired')
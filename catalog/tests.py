@@ -1,3 +1,515 @@
-from django.test import TestCase
+import io
+import json
+import threading
+import time
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+import requests
+from django.contrib import admin
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from catalog import bgg_price_service
+from catalog.admin import StockReservationAdmin
+from catalog.models import BoardGame, StockReservation
+
+
+def _json_response(payload, status=200):
+    """Build a requests.Response carrying a JSON body."""
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(payload).encode()
+    return response
+
+
+def _stream_response(body=b'', status=200, headers=None):
+    """Build a streamed requests.Response reading body from memory."""
+    response = requests.Response()
+    response.status_code = status
+    response.raw = io.BytesIO(body)
+    response.headers.update(headers or {})
+    return response
+
+
+class FakeClock:
+    """Stands in for the time module: sleep() advances monotonic() and is recorded."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class ParsePriceTests(SimpleTestCase):
+    """Price strings in the formats BoardGamePrices returns."""
+
+    def test_price_formats(self):
+        cases = [
+            ('£12.99', 12.99),
+            ('12.99', 12.99),
+            ('12.99£', 12.99),
+            ('12.99 £', 12.99),
+            ('GBP 12.99', 12.99),
+            ('12.99 GBP', 12.99),
+            ('€12,99', 12.99),
+            ('12,99 €', 12.99),
+            ('EUR 12,99', 12.99),
+            ('$ 12.50', 12.5),
+            ('£\xa012.99', 12.99),
+            ('£1,299.00', 1299.0),
+            ('€1.299,00', 1299.0),
+            ('1.299,00 €', 1299.0),
+            ('12.999', 12.999),
+            ('1.299', 1.299),
+            ('12,5 €', 12.5),
+            ('£15', 15.0),
+            (12.99, 12.99),
+            (15, 15.0),
+        ]
+        for value, expected in cases:
+            with self.subTest(value=value):
+                self.assertEqual(bgg_price_service._parse_price(value), expected)
+
+    def test_unparseable_prices(self):
+        for value in ('', 'N/A', '£', None, '1,2.99', '12.99.5', 'call for price'):
+            with self.subTest(value=value):
+                self.assertIsNone(bgg_price_service._parse_price(value))
+
+
+class FetchBoardGamePricesTests(SimpleTestCase):
+
+    def _fetch(self, price, currency):
+        payload = {'prices': [{'price': price, 'currency': currency, 'shop': 'Shop', 'url': 'https://shop'}]}
+        with mock.patch.object(bgg_price_service._SESSION, 'get', return_value=_json_response(payload)):
+            return bgg_price_service._fetch_boardgameprices('13')
+
+    def test_gbp_price_is_converted_to_eur(self):
+        result = self._fetch('GBP 10.00', 'GBP')
+        self.assertEqual(result['price'], round(10 * bgg_price_service.GBP_TO_EUR, 2))
+        self.assertEqual(result['store'], 'Shop')
+
+    def test_eur_price_is_kept(self):
+        self.assertEqual(self._fetch('12,99 €', 'EUR')['price'], 12.99)
+
+    def test_unparseable_price_returns_nothing(self):
+        self.assertEqual(self._fetch('N/A', 'GBP'), {})
+
+
+@mock.patch.object(StockReservationAdmin, 'message_user')
+class StockReservationAdminActionTests(TestCase):
+
+    def setUp(self):
+        self.admin = StockReservationAdmin(StockReservation, admin.site)
+        self.request = RequestFactory().post('/admin/catalog/stockreservation/')
+        self.game = BoardGame.objects.create(name='Catan', stock_quantity=2)
+
+    def _reserve(self, status='active', quantity=1, game=None):
+        return StockReservation.objects.create(
+            game=game or self.game,
+            quantity=quantity,
+            status=status,
+            customer_name='Ana',
+            customer_email='ana@example.com',
+            session_key='session',
+        )
+
+    def _run(self, action, *reservations):
+        queryset = StockReservation.objects.filter(pk__in=[r.pk for r in reservations])
+        getattr(self.admin, action)(self.request, queryset)
+
+    def test_confirm_decrements_stock(self, message_user):
+        reservation = self._reserve()
+        self._run('confirm_selected_reservations', reservation)
+        
+        self.game.refresh_from_db()
+        reservation.refresh_from_db()
+        self.assertEqual(self.game.stock_quantity, 1)
+        self.assertFalse(self.game.is_sold)
+        self.assertIsNone(self.game.sold_date)
+        self.assertEqual(reservation.status, 'confirmed')
+        self.assertIsNotNone(reservation.confirmed_at)
+
+    def test_confirm_marks_game_sold_when_stock_runs_out(self, message_user):
+        other_game = BoardGame.objects.create(name='Azul', stock_quantity=5)
+        reservations = [self._reserve(), self._reserve(), self._reserve(game=other_game, quantity=2)]
+        self._run('confirm_selected_reservations', *reservations)
+        
+        self.game.refresh_from_db()
+        other_game.refresh_from_db()
+        self.assertEqual(self.game.stock_quantity, 0)
+        self.assertTrue(self.game.is_sold)
+        self.assertIsNotNone(self.game.sold_date)
+        self.assertEqual(other_game.stock_quantity, 3)
+        self.assertFalse(other_game.is_sold)
+
+    def test_confirm_ignores_non_active_reservations(self, message_user):
+        reservations = [self._reserve(status) for status in ('confirmed', 'cancelled', 'expired')]
+        self._run('confirm_selected_reservations', *reservations)
+        
+        self.game.refresh_from_db()
+        self.assertEqual(self.game.stock_quantity, 2)
+        self.assertFalse(self.game.is_sold)
+        for reservation in reservations:
+            status = reservation.status
+            reservation.refresh_from_db()
+            self.assertEqual(reservation.status, status)
+            self.assertIsNone(reservation.confirmed_at)
+        message_user.assert_called_once_with(self.request, 'No active reservations selected.')
+
+    def test_cancel_only_affects_active_reservations(self, message_user):
+        active = self._reserve()
+        others = [self._reserve(status) for status in ('confirmed', 'cancelled', 'expired')]
+        self._run('cancel_selected_reservations', active, *others)
+        
+        active.refresh_from_db()
+        self.assertEqual(active.status, 'cancelled')
+        self.assertIsNotNone(active.cancelled_at)
+        for reservation in others:
+            status = reservation.status
+            reservation.refresh_from_db()
+            self.assertEqual(reservation.status, status)
+            self.assertIsNone(reservation.cancelled_at)
+        message_user.assert_called_once_with(self.request, '1 reservation(s) cancelled.')
+
+    def test_extend_only_affects_active_reservations(self, message_user):
+        soon = timezone.now() + timedelta(minutes=5)
+        active = self._reserve()
+        others = [self._reserve(status) for status in ('confirmed', 'cancelled', 'expired')]
+        StockReservation.objects.update(expires_at=soon)
+        self._run('extend_selected_reservations', active, *others)
+        
+        active.refresh_from_db()
+        self.assertGreater(active.expires_at, timezone.now() + timedelta(minutes=29))
+        self.assertEqual(active.status, 'active')
+        for reservation in others:
+            reservation.refresh_from_db()
+            self.assertEqual(reservation.expires_at, soon)
+        message_user.assert_called_once_with(self.request, '1 reservation(s) extended.')
+
+
+class ExtractGeekPreloadTests(SimpleTestCase):
+
+    def _page(self, blob):
+        return b'<html><script>GEEK.geekitemPreload = ' + blob + b';\nGEEK.other = {};</script></html>'
+
+    def test_extracts_object(self):
+        blob = b'{"item": {"name": "Catan", "stats": {"average": 7.1}}}'
+        preload = bgg_price_service._extract_geek_preload(self._page(blob))
+        self.assertEqual(preload, blob)
+
+    def test_braces_and_escaped_quotes_inside_strings(self):
+        blob = rb'{"item": {"name": "A \"}{\" game", "description": "{{ not a brace }", "path": "C:\\"}}'
+        preload = bgg_price_service._extract_geek_preload(self._page(blob))
+        self.assertEqual(preload, blob)
+        self.assertEqual(json.loads(preload)['item']['name'], 'A "}{" game')
+
+    def test_blob_truncated_at_read_limit(self):
+        limit = bgg_price_service.SCRAPE_MAX_BYTES
+        # Cut inside a long string full of closing braces
+        page = self._page(b'{"item": {"description": "' + b'x}' * limit + b'"}}')
+        self.assertIsNone(bgg_price_service._extract_geek_preload(page[:limit]))
+        # Cut between objects, outside any string
+        page = self._page(b'{"item": {"links": [' + b'{"name": "x"}, ' * limit + b'{}]}}')
+        self.assertIsNone(bgg_price_service._extract_geek_preload(page[:limit]))
+
+    def test_truncated_inside_string_with_closing_braces(self):
+        for cut in (b'{"item": {"name": "}}', b'{"item": {"name": "}}\\'):
+            with self.subTest(cut=cut):
+                page = b'GEEK.geekitemPreload = ' + cut
+                self.assertIsNone(bgg_price_service._extract_geek_preload(page))
+
+    def test_missing_marker(self):
+        page = b'<html><script>GEEK.somethingElse = {"item": {}};</script></html>'
+        self.assertIsNone(bgg_price_service._extract_geek_preload(page))
+
+    def test_marker_without_assignment(self):
+        page = b'<html><script>if (GEEK.geekitemPreload) { run({"item": {}}); }</script></html>'
+        self.assertIsNone(bgg_price_service._extract_geek_preload(page))
+
+
+class LastKnownGoodTests(SimpleTestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_only_fresh_fetches_write_the_last_known_good_copy(self):
+        key = bgg_price_service._last_known_good_key('13')
+        with mock.patch.object(bgg_price_service, '_fetch_bgg_xml_details', return_value={'name': 'Catan'}):
+            self.assertEqual(bgg_price_service.get_bgg_game_details('13'), {'name': 'Catan'})
+        self.assertEqual(cache.get(key), {'name': 'Catan'})
+        
+        # A cache hit leaves the last known good copy alone
+        cache.delete(key)
+        self.assertEqual(bgg_price_service.get_bgg_game_details('13'), {'name': 'Catan'})
+        self.assertIsNone(cache.get(key))
+
+    def test_stale_copy_served_when_every_source_fails(self):
+        cache.set(bgg_price_service._last_known_good_key('13'), {'name': 'Catan'}, None)
+        with mock.patch.object(bgg_price_service, '_fetch_bgg_xml_details', return_value={}), \
+                mock.patch.object(bgg_price_service, '_scrape_bgg_game_page', return_value={}):
+            details = bgg_price_service.get_bgg_game_details('13')
+        self.assertEqual(details, {'name': 'Catan', 'stale': True})
+
+
+class TokenBucketTests(SimpleTestCase):
+
+    def test_burst_then_throttle(self):
+        clock = FakeClock()
+        with mock.patch.object(bgg_price_service, 'time', clock):
+            bucket = bgg_price_service._TokenBucket(rate=2, capacity=4)
+            for _ in range(4):
+                bucket.acquire()
+            self.assertEqual(clock.sleeps, [])
+            
+            # Past the burst, requests are spaced 1/rate apart
+            bucket.acquire()
+            bucket.acquire()
+            self.assertEqual(clock.sleeps, [0.5, 0.5])
+            
+            # An idle period refills the bucket, but never beyond its capacity
+            clock.now += 60
+            for _ in range(4):
+                bucket.acquire()
+            self.assertEqual(len(clock.sleeps), 2)
+            bucket.acquire()
+            self.assertEqual(clock.sleeps[-1], 0.5)
+
+
+class RateLimitedAdapterTests(SimpleTestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.object(bgg_price_service, 'time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.adapter = bgg_price_service._RateLimitedAdapter(
+            1,
+            bgg_price_service._TokenBucket(rate=1000, capacity=1000),
+            bgg_price_service._BoundedRetry(
+                total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False,
+            ),
+        )
+        self.request = requests.Request('GET', 'https://boardgamegeek.com/boardgame/13').prepare()
+
+    def _send(self, side_effect):
+        with mock.patch.object(bgg_price_service._KeepAliveAdapter, 'send', side_effect=side_effect) as send:
+            try:
+                return self.adapter.send(self.request), send.call_count
+            except Exception as e:
+                return e, send.call_count
+
+    def _slot_free(self):
+        if self.adapter._slots.acquire(blocking=False):
+            self.adapter._slots.release()
+            return True
+        return False
+
+    def test_throttled_responses_retry_at_most_total_times(self):
+        for status in (429, 503):
+            with self.subTest(status=status):
+                self.clock.sleeps.clear()
+                response, calls = self._send(
+                    lambda *args, **kwargs: _stream_response(status=status, headers={'Retry-After': '120'})
+                )
+                self.assertEqual(response.status_code, status)
+                self.assertEqual(calls, 4)
+                # Retry-After is honoured only up to RETRY_AFTER_MAX
+                self.assertEqual(self.clock.sleeps, [bgg_price_service.RETRY_AFTER_MAX] * 3)
+
+    def test_success_after_throttling(self):
+        responses = iter([_stream_response(status=503), _stream_response(b'ok')])
+        response, calls = self._send(lambda *args, **kwargs: next(responses))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(calls, 2)
+        self.assertEqual(len(self.clock.sleeps), 1)
+
+    def test_slot_released_while_backing_off(self):
+        slot_free_during_sleep = []
+        sleep = self.clock.sleep
+
+        def record_sleep(seconds):
+            slot_free_during_sleep.append(self._slot_free())
+            sleep(seconds)
+
+        self.clock.sleep = record_sleep
+        self._send(lambda *args, **kwargs: _stream_response(status=503))
+        self.assertEqual(slot_free_during_sleep, [True, True, True])
+
+    def test_slot_released_on_exceptions(self):
+        cases = [
+            (requests.ConnectionError('refused'), 4),
+            (requests.Timeout('slow'), 4),
+            (requests.exceptions.SSLError('bad certificate'), 1),
+            (ValueError('unexpected'), 1),
+        ]
+        for exc, expected_calls in cases:
+            with self.subTest(exc=type(exc).__name__):
+                error, calls = self._send(exc)
+                self.assertIs(error, exc)
+                self.assertEqual(calls, expected_calls)
+                self.assertTrue(self._slot_free())
+
+
+class CheckoutTests(TestCase):
+
+    def setUp(self):
+        self.game = BoardGame.objects.create(name='Catan', stock_quantity=2)
+        self.other_game = BoardGame.objects.create(name='Azul', stock_quantity=1)
+        self.customer = {'customer_name': 'Ana', 'customer_email': 'ana@example.com'}
+
+    def _set_cart(self, cart):
+        session = self.client.session
+        session['cart'] = {str(game.id): quantity for game, quantity in cart}
+        session.save()
+
+    @mock.patch('catalog.cart_views._send_quote_email')
+    def test_reservations_expire_after_reservation_duration(self, send_quote_email):
+        self._set_cart([(self.game, 2), (self.other_game, 1)])
+        before = timezone.now()
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse('checkout'), self.customer)
+        after = timezone.now()
+        
+        self.assertRedirects(response, reverse('checkout_success'), fetch_redirect_response=False)
+        reservations = StockReservation.objects.order_by('game__name')
+        self.assertEqual([(r.game, r.quantity, r.status) for r in reservations],
+                         [(self.other_game, 1, 'active'), (self.game, 2, 'active')])
+        duration = StockReservation.RESERVATION_DURATION
+        for reservation in reservations:
+            self.assertGreaterEqual(reservation.expires_at, before + duration)
+            self.assertLessEqual(reservation.expires_at, after + duration)
+        self.assertEqual(self.client.session['cart'], {})
+
+    @mock.patch('catalog.cart_views._send_quote_email')
+    def test_insufficient_stock_rolls_back_every_reservation(self, send_quote_email):
+        StockReservation.objects.create(
+            game=self.other_game, quantity=1, customer_name='Bo',
+            customer_email='bo@example.com', session_key='other',
+        )
+        self._set_cart([(self.game, 1), (self.other_game, 1)])
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            response = self.client.post(reverse('checkout'), self.customer)
+        
+        self.assertRedirects(response, reverse('view_cart'), fetch_redirect_response=False)
+        # Only the pre-existing reservation remains; the valid cart line was rolled back too
+        self.assertEqual(StockReservation.objects.filter(customer_email='ana@example.com').count(), 0)
+        self.assertEqual(StockReservation.objects.count(), 1)
+        self.assertEqual(len(self.client.session['cart']), 2)
+        self.assertEqual(callbacks, [])
+        send_quote_email.assert_not_called()
+
+    @mock.patch('catalog.cart_views._send_quote_email')
+    def test_quote_email_sent_only_after_commit(self, send_quote_email):
+        self._set_cart([(self.game, 1)])
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            self.client.post(reverse('checkout'), self.customer)
+            send_quote_email.assert_not_called()
+        
+        self.assertEqual(len(callbacks), 1)
+        callbacks[0]()
+        reservation = StockReservation.objects.get()
+        send_quote_email.assert_called_once_with('ana@example.com', 'Ana', [reservation])
+
+
+class FirstResultTests(SimpleTestCase):
+
+    def test_fast_primary_never_starts_fallbacks(self):
+        fallback = mock.Mock(return_value=['fallback'])
+        result = bgg_price_service._first_result(
+            [('primary', lambda: ['primary']), ('fallback', fallback)], head_start=5,
+        )
+        self.assertEqual(result, ('primary', ['primary']))
+        fallback.assert_not_called()
+
+    def test_slow_primary_starts_fallbacks_after_head_start(self):
+        fallback_started = threading.Event()
+
+        def slow_primary(value):
+            # Only finishes once the fallback is running alongside it
+            self.assertTrue(fallback_started.wait(5))
+            return value
+
+        def fallback():
+            fallback_started.set()
+            return ['fallback']
+
+        for value, expected in ((['primary'], ('primary', ['primary'])), ([], ('fallback', ['fallback']))):
+            with self.subTest(value=value):
+                fallback_started.clear()
+                result = bgg_price_service._first_result(
+                    [('primary', slow_primary, value), ('fallback', fallback)], head_start=0.05,
+                )
+                # Priority order: a usable primary result wins over the faster fallback
+                self.assertEqual(result, expected)
+
+    def test_failing_primary_starts_fallbacks_immediately(self):
+        def failing_primary():
+            raise ValueError('boom')
+
+        started = time.monotonic()
+        result = bgg_price_service._first_result(
+            [('primary', failing_primary), ('fallback', lambda: ['fallback'])], head_start=5,
+        )
+        self.assertEqual(result, ('fallback', ['fallback']))
+        self.assertLess(time.monotonic() - started, 2)
+
+    def test_every_lookup_failing(self):
+        result = bgg_price_service._first_result(
+            [('primary', lambda: []), ('fallback', lambda: [])], head_start=5,
+        )
+        self.assertEqual(result, (None, []))
+
+
+class ConditionalGamePageTests(SimpleTestCase):
+
+    PAGE = b'<html><head><meta property="og:title" content="Catan"></head><body></body></html>'
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def _scrape(self, response):
+        with mock.patch.object(bgg_price_service._SESSION, 'get', return_value=response) as get:
+            return bgg_price_service._scrape_bgg_game_page('13'), get.call_args.kwargs['headers']
+
+    def test_not_modified_reuses_cached_data_without_parsing(self):
+        first = _stream_response(self.PAGE, headers={
+            'ETag': '"v1"', 'Last-Modified': 'Wed, 14 Oct 2026 10:00:00 GMT', 'Content-Type': 'text/html; charset=utf-8',
+        })
+        game_data, headers = self._scrape(first)
+        self.assertEqual(game_data['name'], 'Catan')
+        self.assertEqual(headers, {})
+        
+        with mock.patch.object(bgg_price_service, '_parse_bgg_game_page') as parse:
+            cached, headers = self._scrape(_stream_response(status=304))
+        parse.assert_not_called()
+        self.assertEqual(cached, game_data)
+        self.assertEqual(headers, {
+            'If-None-Match': '"v1"', 'If-Modified-Since': 'Wed, 14 Oct 2026 10:00:00 GMT',
+        })
+
+    def test_changed_page_replaces_validators(self):
+        self._scrape(_stream_response(self.PAGE, headers={'ETag': '"v1"'}))
+        page = self.PAGE.replace(b'Catan', b'Catan 2')
+        game_data, headers = self._scrape(_stream_response(page, headers={'ETag': '"v2"'}))
+        self.assertEqual(headers, {'If-None-Match': '"v1"'})
+        self.assertEqual(game_data['name'], 'Catan 2')
+        
+        cached, headers = self._scrape(_stream_response(status=304))
+        self.assertEqual(headers, {'If-None-Match': '"v2"'})
+        self.assertEqual(cached['name'], 'Catan 2')
+
+    def test_304_without_cached_validators_is_a_failure(self):
+        game_data, headers = self._scrape(_stream_response(status=304))
+        self.assertEqual(headers, {})
+        self.assertEqual(game_data, {})